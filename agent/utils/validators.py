@@ -7,6 +7,7 @@ TOOLS_REQUIRING_PROJECT = {
     "jira_list_issues",
     "jira_create_issues_batch",
     "pm_link_meeting_issues",
+    "pm_link_meetings_batch",
     "pm_get_meeting_issues",
     "pm_get_project_snapshot",
 }
@@ -46,6 +46,8 @@ def main() -> None:
         host=settings.server_host,
         port=settings.server_port,
         log_level="info",
+        # uvloop when installed (everywhere but Windows), asyncio otherwise
+        loop="auto",
     )
 
 
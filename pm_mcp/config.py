@@ -44,6 +44,16 @@ class Settings(BaseSettings):
     # Server settings
     server_host: str = Field(default="0.0.0.0", description="Server host")
     server_port: int = Field(default=8000, description="Server port")
+    worker_threads: int = Field(
+        default=10,
+        ge=1,
+        description="Size of the thread pool running blocking Jira/Confluence/Calendar calls",
+    )
+    calendar_max_concurrency: int = Field(
+        default=10,
+        ge=1,
+        description="Max concurrent Google Calendar API calls (stays under per-second quota)",
+    )
 
     # Logging and Observability
 
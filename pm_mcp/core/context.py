@@ -0,0 +1,26 @@
+"""Helpers for logging to the MCP client from tools."""
+
+import logging
+from typing import Any
+
+from fastmcp.server.context import Context
+
+logger = logging.getLogger("pm_mcp.tools")
+
+
+def is_debug_enabled() -> bool:
+    """Return True if debug messages for the client are enabled.
+
+    Use it to skip building expensive log_debug arguments (e.g. lists).
+    """
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+async def log_debug(ctx: Context, template: str, *args: Any) -> None:
+    """Send a debug message to the client only when DEBUG logging is enabled.
+
+    The message is %-formatted lazily, so disabled debug output costs
+    neither the formatting nor the client round-trip.
+    """
+    if is_debug_enabled():
+        await ctx.debug(template % args if args else template)
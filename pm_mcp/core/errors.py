@@ -82,7 +82,7 @@ class CalendarError(McpError):
 
 
 class PmError(McpError):
-    """PM layer (database) specific error."""
+    """PM layer specific error."""
 
     def __init__(
         self,
@@ -6,7 +6,13 @@ from pydantic import BaseModel, ConfigDict
 
 
 class BaseMcpModel(BaseModel):
-    """Base model with common configuration for all MCP models."""
+    """Base model with common configuration for all MCP models.
+
+    Tools that return large lists build their responses with
+    ``model_construct`` from dicts the services already shape (or from lists
+    validated once through a TypeAdapter), skipping a second validation pass.
+    Service result dicts feeding those responses must stay type-correct.
+    """
 
     model_config = ConfigDict(
         populate_by_name=True,
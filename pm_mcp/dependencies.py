@@ -10,11 +10,7 @@ The recommended DI pattern for 2.13.x is attaching services to
 the mcp instance and accessing via ctx.fastmcp.
 """
 
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator
-
 from pm_mcp.config import Settings, get_settings
-from pm_mcp.core.database import get_db_pool
 from pm_mcp.services.calendar_service import CalendarService
 from pm_mcp.services.confluence_service import ConfluenceService
 from pm_mcp.services.jira_service import JiraService
@@ -57,21 +53,13 @@ def get_calendar_service(settings: Settings | None = None) -> CalendarService:
     return CalendarService(settings or get_settings())
 
 
-@asynccontextmanager
-async def get_pm_service(
-    settings: Settings | None = None,
-) -> AsyncGenerator[PmService, None]:
-    """Async context manager for PmService with database connection.
-
-    PmService requires database pool initialization, so we use
-    asynccontextmanager pattern for proper resource management.
+def get_pm_service(settings: Settings | None = None) -> PmService:
+    """Create PmService instance.
 
     Args:
         settings: Optional settings override. If None, uses default settings.
 
-    Yields:
-        PmService instance with initialized database connection.
+    Returns:
+        PmService instance.
     """
-    db_pool = await get_db_pool()
-    pm_service = PmService(db_pool, settings or get_settings())
-    yield pm_service
+    return PmService(settings or get_settings())
@@ -1,6 +1,8 @@
 """FastMCP server initialization and configuration."""
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 
@@ -63,16 +65,27 @@ def create_http_app():
         settings = get_settings()
 
         # Setup logging level from settings
+        log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
         logging.basicConfig(
-            level=getattr(logging, settings.log_level, logging.INFO),
+            level=log_level,
             format="%(asctime)s %(levelname)s %(name)s %(message)s",
         )
+        # basicConfig is a no-op once __main__ has configured the root logger,
+        # so set the package level explicitly (log_debug follows it)
+        logging.getLogger("pm_mcp").setLevel(log_level)
 
         # Initialize OpenTelemetry with settings
         init_telemetry(settings)
 
         logger.info("Starting PM MCP Server (HTTP transport)...")
 
+        # Fixed-size executor for asyncio.to_thread (all blocking API clients)
+        executor = ThreadPoolExecutor(
+            max_workers=settings.worker_threads,
+            thread_name_prefix="pm-mcp-io",
+        )
+        asyncio.get_running_loop().set_default_executor(executor)
+
         # Initialize all services
         mcp.jira_service = JiraService(settings)
         mcp.confluence_service = ConfluenceService(settings)
@@ -84,6 +97,7 @@ def create_http_app():
 
         # Cleanup
         logger.info("Shutting down PM MCP Server...")
+        executor.shutdown(wait=False, cancel_futures=True)
         logger.info("Cleanup completed")
 
     @asynccontextmanager
@@ -6,6 +6,8 @@ from abc import ABC
 from functools import wraps
 from typing import Any, Callable, ParamSpec, TypeVar
 
+import orjson
+
 from pm_mcp.config import Settings, get_settings
 from pm_mcp.core.metrics import API_CALLS
 
@@ -15,6 +17,20 @@ P = ParamSpec("P")
 T = TypeVar("T")
 
 
+def json_dumps(value: Any) -> str:
+    """Serialize value to a compact JSON string."""
+    return orjson.dumps(value).decode()
+
+
+def json_loads(value: str | bytes) -> Any:
+    """Deserialize a JSON string."""
+    return orjson.loads(value)
+
+
+# Backslash-escape the characters that can break out of a quoted JQL/CQL string
+_QUERY_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "'": "\\'"})
+
+
 def escape_query_value(value: str) -> str:
     """Escape special characters for JQL/CQL queries.
 
@@ -23,11 +39,7 @@ def escape_query_value(value: str) -> str:
     """
     if not value:
         return value
-    special_chars = ["\\", '"', "'"]
-    result = value
-    for char in special_chars:
-        result = result.replace(char, f"\\{char}")
-    return result
+    return value.translate(_QUERY_ESCAPES)
 
 
 def run_in_thread(func: Callable[P, T]) -> Callable[P, T]:
@@ -48,7 +60,10 @@ class BaseService(ABC):
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def _log_error(
-        self, operation: str, error: Exception, extra_context: dict[str, Any] | None = None
+        self,
+        operation: str,
+        error: Exception,
+        extra_context: dict[str, Any] | None = None,
     ) -> None:
         """Log error with context."""
         if extra_context:
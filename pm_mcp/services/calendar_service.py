@@ -1,17 +1,59 @@
 """Google Calendar API service."""
 
 import asyncio
-import json
+import re
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, TypeVar
 
+from cachetools import TTLCache
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from pm_mcp.config import Settings
 from pm_mcp.core.errors import CalendarError
-from pm_mcp.services.base import BaseService
+from pm_mcp.services.base import BaseService, json_dumps, json_loads
+
+# Encoded jiraIssues value for meetings without linked issues
+EMPTY_JSON_LIST = "[]"
+
+# Partial response for metadata reads: only what _decode_event_metadata uses
+EVENT_METADATA_FIELDS = "summary,start(dateTime),extendedProperties(private)"
+
+# "key=value" lines of a project calendar description (known keys only)
+_CALENDAR_METADATA_RE = re.compile(
+    r"^[ \t]*(jira_project_key|confluence_space_key)[ \t]*=[ \t]*(.*?)[ \t\r]*$",
+    re.MULTILINE,
+)
+
+# Project calendars rarely change; cache lookups to skip calendarList calls
+PROJECT_CALENDAR_CACHE_SIZE = 256
+PROJECT_CALENDAR_CACHE_TTL = 300  # seconds
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=1024)
+def _parse_calendar_description(
+    description: str | None,
+) -> tuple[str | None, str | None]:
+    """Parse (jira_project_key, confluence_space_key) from a calendar description.
+
+    Cached because the same few descriptions are re-parsed on every
+    calendar lookup.
+    """
+    if not description:
+        return None, None
+
+    metadata: dict[str, str | None] = {
+        match.group(1): match.group(2)
+        for match in _CALENDAR_METADATA_RE.finditer(description)
+    }
+    return metadata.get("jira_project_key"), metadata.get("confluence_space_key")
 
 
 class CalendarService(BaseService):
@@ -20,6 +62,40 @@ class CalendarService(BaseService):
     def __init__(self, settings: Settings | None = None) -> None:
         super().__init__(settings)
         self._service = None
+        self._project_calendar_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+            maxsize=PROJECT_CALENDAR_CACHE_SIZE, ttl=PROJECT_CALENDAR_CACHE_TTL
+        )
+        # One in-flight lookup per project: concurrent misses must not
+        # each create a calendar. Locks are dropped once no caller holds or
+        # waits on them, so the map only tracks lookups in progress
+        self._project_calendar_locks: dict[str, asyncio.Lock] = {}
+        self._project_calendar_lock_users: Counter[str] = Counter()
+        # Shared by every Calendar API call, so fan-out from batch tools
+        # cannot burst past Google's per-second quota into 403/429 retries
+        self._api_semaphore = asyncio.Semaphore(self.settings.calendar_max_concurrency)
+
+    async def _call_api(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking Calendar API method in a thread, bounded by the semaphore."""
+        async with self._api_semaphore:
+            return await asyncio.to_thread(func, *args)
+
+    def clear_cache(self) -> None:
+        """Drop all cached project calendar lookups."""
+        self._project_calendar_cache.clear()
+
+    @asynccontextmanager
+    async def _project_calendar_lock(self, project_key: str) -> AsyncIterator[None]:
+        """Hold the lookup lock for project_key, removing it when unused."""
+        lock = self._project_calendar_locks.setdefault(project_key, asyncio.Lock())
+        self._project_calendar_lock_users[project_key] += 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._project_calendar_lock_users[project_key] -= 1
+            if not self._project_calendar_lock_users[project_key]:
+                del self._project_calendar_lock_users[project_key]
+                del self._project_calendar_locks[project_key]
 
     def _get_service(self) -> Any:
         """Get or create Google Calendar service with Service Account."""
@@ -48,21 +124,13 @@ class CalendarService(BaseService):
             jira_project_key=ALPHA
             confluence_space_key=ALPHA
         """
-        metadata = {"jira_project_key": None, "confluence_space_key": None}
-
-        if not description:
-            return metadata
-
-        for line in description.strip().split("\n"):
-            line = line.strip()
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-                if key in metadata:
-                    metadata[key] = value
-
-        return metadata
+        jira_project_key, confluence_space_key = _parse_calendar_description(
+            description
+        )
+        return {
+            "jira_project_key": jira_project_key,
+            "confluence_space_key": confluence_space_key,
+        }
 
     def _list_calendars_sync(self) -> list[dict[str, Any]]:
         """List all calendars accessible to service account."""
@@ -96,7 +164,7 @@ class CalendarService(BaseService):
 
     async def list_calendars(self) -> list[dict[str, Any]]:
         """List all calendars asynchronously."""
-        return await asyncio.to_thread(self._list_calendars_sync)
+        return await self._call_api(self._list_calendars_sync)
 
     def _create_project_calendar_sync(
         self,
@@ -139,16 +207,14 @@ class CalendarService(BaseService):
                     },
                 ).execute()
 
-            metadata = self._parse_calendar_metadata(
-                created_calendar.get("description")
-            )
+            # Metadata is what we just wrote into the description; no re-parse
             return {
                 "calendar_id": calendar_id,
                 "name": created_calendar.get("summary"),
                 "description": created_calendar.get("description"),
                 "primary": False,
-                "jira_project_key": metadata.get("jira_project_key"),
-                "confluence_space_key": metadata.get("confluence_space_key"),
+                "jira_project_key": project_key,
+                "confluence_space_key": confluence_space_key or None,
                 "created": True,
             }
 
@@ -165,7 +231,7 @@ class CalendarService(BaseService):
         confluence_space_key: str | None = None,
     ) -> dict[str, Any]:
         """Create calendar for project asynchronously."""
-        return await asyncio.to_thread(
+        return await self._call_api(
             self._create_project_calendar_sync,
             project_key,
             confluence_space_key,
@@ -204,12 +270,28 @@ class CalendarService(BaseService):
         project_key: str,
         confluence_space_key: str | None = None,
     ) -> dict[str, Any]:
-        """Find or create project calendar asynchronously."""
-        return await asyncio.to_thread(
-            self._find_or_create_project_calendar_sync,
-            project_key,
-            confluence_space_key,
-        )
+        """Find or create project calendar asynchronously.
+
+        Results are cached per project_key, so repeat lookups report
+        created=False without calling the API. Concurrent misses for the
+        same project wait for the first lookup instead of repeating it.
+        """
+        cached = self._project_calendar_cache.get(project_key)
+        if cached is not None:
+            return {**cached, "created": False}
+
+        async with self._project_calendar_lock(project_key):
+            cached = self._project_calendar_cache.get(project_key)
+            if cached is not None:
+                return {**cached, "created": False}
+
+            calendar = await self._call_api(
+                self._find_or_create_project_calendar_sync,
+                project_key,
+                confluence_space_key,
+            )
+            self._project_calendar_cache[project_key] = dict(calendar)
+            return calendar
 
     def _list_events_sync(
         self,
@@ -218,8 +300,9 @@ class CalendarService(BaseService):
         time_max: datetime | None = None,
         text_query: str | None = None,
         max_results: int = 50,
-    ) -> list[dict[str, Any]]:
-        """Synchronous method to list calendar events."""
+        page_token: str | None = None,
+    ) -> dict[str, Any]:
+        """Synchronous method to list one page of calendar events."""
         service = self._get_service()
 
         now = datetime.now(timezone.utc)
@@ -227,6 +310,11 @@ class CalendarService(BaseService):
             time_min = now - timedelta(days=7)
         if time_max is None:
             time_max = now + timedelta(days=7)
+        # Google needs an explicit offset; treat naive datetimes as UTC
+        if time_min.tzinfo is None:
+            time_min = time_min.replace(tzinfo=timezone.utc)
+        if time_max.tzinfo is None:
+            time_max = time_max.replace(tzinfo=timezone.utc)
 
         try:
             request_params: dict[str, Any] = {
@@ -240,6 +328,8 @@ class CalendarService(BaseService):
 
             if text_query:
                 request_params["q"] = text_query
+            if page_token:
+                request_params["pageToken"] = page_token
 
             events_result = service.events().list(**request_params).execute()
             events = events_result.get("items", [])
@@ -271,7 +361,10 @@ class CalendarService(BaseService):
                     }
                 )
 
-            return result
+            return {
+                "events": result,
+                "next_page_token": events_result.get("nextPageToken"),
+            }
 
         except HttpError as e:
             self._log_error("list_events", e)
@@ -292,31 +385,36 @@ class CalendarService(BaseService):
         time_max: datetime | None = None,
         text_query: str | None = None,
         max_results: int = 50,
-    ) -> list[dict[str, Any]]:
-        """List calendar events asynchronously."""
-        return await asyncio.to_thread(
+        page_token: str | None = None,
+    ) -> dict[str, Any]:
+        """List one page of calendar events asynchronously.
+
+        Returns {"events": [...], "next_page_token": str | None}; pass the
+        token back as page_token to fetch the next page.
+        """
+        return await self._call_api(
             self._list_events_sync,
             calendar_id,
             time_min,
             time_max,
             text_query,
             max_results,
+            page_token,
         )
 
-    def _update_event_metadata_sync(
+    def _encode_event_metadata(
         self,
-        calendar_id: str,
-        event_id: str,
         jira_issues: list[str],
         confluence_page_id: str | None = None,
         project_key: str | None = None,
-    ) -> dict[str, Any]:
-        """Sync implementation of update event metadata."""
-        service = self._get_service()
+    ) -> dict[str, str]:
+        """Encode PM metadata into extendedProperties.private values.
 
-        # Валидация размера (превентивная проверка)
+        Single place where the jiraIssues list is serialized; callers pass
+        native lists.
+        """
         metadata = {
-            "jiraIssues": json.dumps(jira_issues),
+            "jiraIssues": json_dumps(jira_issues) if jira_issues else EMPTY_JSON_LIST,
         }
         if confluence_page_id:
             metadata["confluencePageId"] = confluence_page_id
@@ -324,13 +422,45 @@ class CalendarService(BaseService):
             metadata["projectKey"] = project_key
 
         # Проверка размера (Google API лимит ~8KB для extendedProperties)
-        metadata_size = len(json.dumps(metadata))
+        metadata_size = len(json_dumps(metadata))
         if metadata_size > 7000:  # Safety margin
             raise ValueError(
                 f"Metadata size ({metadata_size} bytes) exceeds safe limit. "
                 f"Consider reducing number of linked issues (current: {len(jira_issues)})"
             )
 
+        return metadata
+
+    def _decode_event_metadata(
+        self, event_id: str, event: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Decode PM metadata from a raw event (counterpart of _encode_event_metadata)."""
+        private_props = event.get("extendedProperties", {}).get("private", {})
+        raw_issues = private_props.get("jiraIssues")
+
+        return {
+            "meeting_id": event_id,
+            "issue_keys": json_loads(raw_issues) if raw_issues else [],
+            "confluence_page_id": private_props.get("confluencePageId"),
+            "project_key": private_props.get("projectKey"),
+            "meeting_title": event.get("summary"),
+            "meeting_date": event.get("start", {}).get("dateTime"),
+        }
+
+    def _update_event_metadata_sync(
+        self,
+        calendar_id: str,
+        event_id: str,
+        jira_issues: list[str],
+        confluence_page_id: str | None = None,
+        project_key: str | None = None,
+    ) -> dict[str, Any]:
+        """Sync implementation of update event metadata."""
+        service = self._get_service()
+        metadata = self._encode_event_metadata(
+            jira_issues, confluence_page_id, project_key
+        )
+
         try:
             event = (
                 service.events()
@@ -365,7 +495,7 @@ class CalendarService(BaseService):
         project_key: str | None = None,
     ) -> dict[str, Any]:
         """Update event with PM metadata using extendedProperties.private."""
-        return await asyncio.to_thread(
+        return await self._call_api(
             self._update_event_metadata_sync,
             calendar_id,
             event_id,
@@ -382,31 +512,21 @@ class CalendarService(BaseService):
 
         try:
             event = (
-                service.events().get(calendarId=calendar_id, eventId=event_id).execute()
+                service.events()
+                .get(
+                    calendarId=calendar_id,
+                    eventId=event_id,
+                    fields=EVENT_METADATA_FIELDS,
+                )
+                .execute()
             )
 
-            private_props = event.get("extendedProperties", {}).get("private", {})
-
-            return {
-                "meeting_id": event_id,
-                "issue_keys": json.loads(private_props.get("jiraIssues", "[]")),
-                "confluence_page_id": private_props.get("confluencePageId"),
-                "project_key": private_props.get("projectKey"),
-                "meeting_title": event.get("summary"),
-                "meeting_date": event.get("start", {}).get("dateTime"),
-            }
+            return self._decode_event_metadata(event_id, event)
 
         except HttpError as e:
             # Handle 404 - event not found
             if e.resp.status == 404:
-                return {
-                    "meeting_id": event_id,
-                    "issue_keys": [],
-                    "confluence_page_id": None,
-                    "project_key": None,
-                    "meeting_title": None,
-                    "meeting_date": None,
-                }
+                return self._decode_event_metadata(event_id, {})
             self._log_error("get_event_metadata", e)
             raise CalendarError(
                 message=f"Failed to get event metadata: {e.reason}",
@@ -423,6 +543,6 @@ class CalendarService(BaseService):
         self, calendar_id: str, event_id: str
     ) -> dict[str, Any]:
         """Get PM metadata from event extendedProperties.private."""
-        return await asyncio.to_thread(
+        return await self._call_api(
             self._get_event_metadata_sync, calendar_id, event_id
         )
@@ -5,12 +5,16 @@ from typing import Any
 
 from atlassian import Confluence
 from bs4 import BeautifulSoup
+from cachetools import LRUCache
 from requests import HTTPError
 
 from pm_mcp.config import Settings
 from pm_mcp.core.errors import ConfluenceError
 from pm_mcp.services.base import BaseService, escape_query_value
 
+# Parsed page bodies keyed by (page_id, version): a new version is a new key
+PAGE_CONTENT_CACHE_SIZE = 1024
+
 
 class ConfluenceService(BaseService):
     """Service for Confluence Cloud API operations."""
@@ -18,6 +22,13 @@ class ConfluenceService(BaseService):
     def __init__(self, settings: Settings | None = None) -> None:
         super().__init__(settings)
         self._client: Confluence | None = None
+        self._page_content_cache: LRUCache[tuple[str, int], dict[str, Any]] = LRUCache(
+            maxsize=PAGE_CONTENT_CACHE_SIZE
+        )
+
+    def clear_cache(self) -> None:
+        """Drop all cached page contents."""
+        self._page_content_cache.clear()
 
     def _get_client(self) -> Confluence:
         """Get or create Confluence client."""
@@ -114,6 +125,30 @@ class ConfluenceService(BaseService):
             limit,
         )
 
+    def _get_page_version_sync(self, page_id: str) -> int | None:
+        """Get current version number of a page (metadata only, no body).
+
+        Returns None when Confluence does not report a version number.
+        """
+        client = self._get_client()
+
+        try:
+            page = client.get_page_by_id(page_id, expand="version")
+            return page.get("version", {}).get("number")
+
+        except HTTPError as e:
+            self._log_error("get_page_version", e)
+            raise ConfluenceError(
+                message="Failed to get page version. Check page ID and permissions.",
+                details={"operation": "get_page_version", "page_id": page_id},
+            ) from e
+        except Exception as e:
+            self._log_error("get_page_version", e)
+            raise ConfluenceError(
+                message="Failed to get page version due to an unexpected error.",
+                details={"operation": "get_page_version"},
+            ) from e
+
     def _get_page_content_sync(self, page_id: str) -> dict[str, Any]:
         """Synchronous method to get Confluence page content."""
         client = self._get_client()
@@ -121,7 +156,7 @@ class ConfluenceService(BaseService):
         try:
             page = client.get_page_by_id(
                 page_id,
-                expand="body.storage,space",
+                expand="body.storage,space,version",
             )
 
             html_content = page.get("body", {}).get("storage", {}).get("value", "")
@@ -132,6 +167,7 @@ class ConfluenceService(BaseService):
                 "title": page.get("title", ""),
                 "url": f"{self.settings.confluence_base_url}{page.get('_links', {}).get('webui', '')}",
                 "body_text": text_content,
+                "version": page.get("version", {}).get("number", 0),
             }
 
         except HTTPError as e:
@@ -148,8 +184,23 @@ class ConfluenceService(BaseService):
             ) from e
 
     async def get_page_content(self, page_id: str) -> dict[str, Any]:
-        """Get Confluence page content asynchronously."""
-        return await asyncio.to_thread(self._get_page_content_sync, page_id)
+        """Get Confluence page content asynchronously.
+
+        Parsed content is cached per (page_id, version): a cheap version
+        lookup decides whether the body must be fetched and parsed again.
+        """
+        version = await asyncio.to_thread(self._get_page_version_sync, page_id)
+        if version is not None:
+            cached = self._page_content_cache.get((page_id, version))
+            if cached is not None:
+                return dict(cached)
+
+        page = await asyncio.to_thread(self._get_page_content_sync, page_id)
+        # Key by the version actually fetched, in case the page was edited between
+        # calls; without a version number there is nothing to invalidate on
+        if page["version"]:
+            self._page_content_cache[(page_id, page["version"])] = dict(page)
+        return page
 
     def _create_page_sync(
         self,
@@ -10,6 +10,9 @@ from pm_mcp.config import Settings
 from pm_mcp.core.errors import JiraError
 from pm_mcp.services.base import BaseService, escape_query_value
 
+# Fields requested by list_issues unless the caller narrows them
+DEFAULT_ISSUE_FIELDS = "key,summary,status,assignee,labels,duedate,updated"
+
 
 class JiraService(BaseService):
     """Service for Jira Cloud API operations."""
@@ -73,6 +76,52 @@ class JiraService(BaseService):
 
         return " AND ".join(conditions) if conditions else ""
 
+    def _format_issue(self, issue: dict[str, Any]) -> dict[str, Any]:
+        """Flatten a raw Jira issue into the summary dict returned by the service."""
+        fields = issue.get("fields", {})
+        status = fields.get("status", {})
+        assignee_data = fields.get("assignee") or {}
+        status_category_data = status.get("statusCategory", {})
+
+        return {
+            "key": issue.get("key", ""),
+            "id": issue.get("id", ""),
+            "url": f"{self.settings.jira_base_url}/browse/{issue.get('key', '')}",
+            "summary": fields.get("summary", ""),
+            "status": status.get("name", ""),
+            "status_category": status_category_data.get("name"),
+            "assignee": assignee_data.get("displayName")
+            or assignee_data.get("emailAddress"),
+            "labels": fields.get("labels"),
+            "due_date": fields.get("duedate"),
+            "updated": fields.get("updated"),
+        }
+
+    def _search_sync(
+        self, jql: str, fields: str, max_results: int
+    ) -> list[dict[str, Any]]:
+        """Run a JQL search and return up to max_results raw issues."""
+        client = self._get_client()
+
+        # Jira Cloud caps a search page (100 issues with fields), so follow
+        # nextPageToken until max_results; token paging cannot be parallelized
+        issues: list[dict[str, Any]] = []
+        next_page_token = None
+        while len(issues) < max_results:
+            page = client.enhanced_jql(
+                jql,
+                fields=fields,
+                nextPageToken=next_page_token,
+                limit=max_results - len(issues),
+            )
+            page_issues = page.get("issues", [])
+            issues.extend(page_issues)
+            next_page_token = page.get("nextPageToken")
+            if not next_page_token or not page_issues:
+                break
+
+        return issues[:max_results]
+
     def _list_issues_sync(
         self,
         project_key: str | None = None,
@@ -83,10 +132,9 @@ class JiraService(BaseService):
         updated_to: str | None = None,
         text_query: str | None = None,
         max_results: int = 50,
+        fields: str = DEFAULT_ISSUE_FIELDS,
     ) -> list[dict[str, Any]]:
         """Synchronous method to list Jira issues."""
-        client = self._get_client()
-
         jql = self._build_jql(
             project_key=project_key,
             status_category=status_category,
@@ -98,36 +146,10 @@ class JiraService(BaseService):
         )
 
         try:
-            issues = client.jql(
-                jql or "ORDER BY updated DESC",
-                limit=max_results,
-                fields="key,summary,status,assignee,labels,duedate,updated",
+            issues = self._search_sync(
+                jql or "ORDER BY updated DESC", fields, max_results
             )
-
-            result = []
-            for issue in issues.get("issues", []):
-                fields = issue.get("fields", {})
-                status = fields.get("status", {})
-                assignee_data = fields.get("assignee") or {}
-                status_category_data = status.get("statusCategory", {})
-
-                result.append(
-                    {
-                        "key": issue.get("key", ""),
-                        "id": issue.get("id", ""),
-                        "url": f"{self.settings.jira_base_url}/browse/{issue.get('key', '')}",
-                        "summary": fields.get("summary", ""),
-                        "status": status.get("name", ""),
-                        "status_category": status_category_data.get("name"),
-                        "assignee": assignee_data.get("displayName")
-                        or assignee_data.get("emailAddress"),
-                        "labels": fields.get("labels"),
-                        "due_date": fields.get("duedate"),
-                        "updated": fields.get("updated"),
-                    }
-                )
-
-            return result
+            return [self._format_issue(issue) for issue in issues]
 
         except HTTPError as e:
             self._log_error("list_issues", e)
@@ -152,6 +174,7 @@ class JiraService(BaseService):
         updated_to: str | None = None,
         text_query: str | None = None,
         max_results: int = 50,
+        fields: str = DEFAULT_ISSUE_FIELDS,
     ) -> list[dict[str, Any]]:
         """List Jira issues asynchronously."""
         return await asyncio.to_thread(
@@ -164,6 +187,7 @@ class JiraService(BaseService):
             updated_to,
             text_query,
             max_results,
+            fields,
         )
 
     def _create_issue_sync(
@@ -392,30 +416,13 @@ class JiraService(BaseService):
         try:
             issue = client.issue(
                 issue_key,
-                fields="key,summary,status,assignee,labels,duedate,updated",
+                fields=DEFAULT_ISSUE_FIELDS,
             )
 
             if not issue:
                 return None
 
-            fields = issue.get("fields", {})
-            status = fields.get("status", {})
-            assignee_data = fields.get("assignee") or {}
-            status_category_data = status.get("statusCategory", {})
-
-            return {
-                "key": issue.get("key", ""),
-                "id": issue.get("id", ""),
-                "url": f"{self.settings.jira_base_url}/browse/{issue.get('key', '')}",
-                "summary": fields.get("summary", ""),
-                "status": status.get("name", ""),
-                "status_category": status_category_data.get("name"),
-                "assignee": assignee_data.get("displayName")
-                or assignee_data.get("emailAddress"),
-                "labels": fields.get("labels"),
-                "due_date": fields.get("duedate"),
-                "updated": fields.get("updated"),
-            }
+            return self._format_issue(issue)
 
         except HTTPError:
             # Issue not found or no access
@@ -427,6 +434,44 @@ class JiraService(BaseService):
         """Get a single Jira issue by key asynchronously."""
         return await asyncio.to_thread(self._get_issue_sync, issue_key)
 
+    def _get_issues_by_keys_sync(self, issue_keys: list[str]) -> list[dict[str, Any]]:
+        """Synchronous method to get several Jira issues in one JQL search.
+
+        Keys are escaped to prevent JQL injection.
+        """
+        if not issue_keys:
+            return []
+
+        quoted_keys = ", ".join(f'"{escape_query_value(key)}"' for key in issue_keys)
+
+        try:
+            issues = self._search_sync(
+                f"key in ({quoted_keys})", DEFAULT_ISSUE_FIELDS, len(issue_keys)
+            )
+            return [self._format_issue(issue) for issue in issues]
+
+        except HTTPError as e:
+            # Jira rejects the whole query if any key does not exist
+            self._log_error("get_issues_by_keys", e)
+            raise JiraError(
+                message="Failed to get issues. Check issue keys and permissions.",
+                details={"operation": "get_issues_by_keys"},
+            ) from e
+        except Exception as e:
+            self._log_error("get_issues_by_keys", e)
+            raise JiraError(
+                message="Failed to get issues due to an unexpected error.",
+                details={"operation": "get_issues_by_keys"},
+            ) from e
+
+    async def get_issues_by_keys(self, issue_keys: list[str]) -> list[dict[str, Any]]:
+        """Get several Jira issues by key with a single search asynchronously.
+
+        Returns the issues found, in no particular order; keys that were
+        deleted or moved are simply absent.
+        """
+        return await asyncio.to_thread(self._get_issues_by_keys_sync, issue_keys)
+
     def _add_meeting_label_sync(
         self,
         issue_key: str,
@@ -437,13 +482,8 @@ class JiraService(BaseService):
         client = self._get_client()
 
         try:
-            issue = client.issue(issue_key)
-            current_labels = issue["fields"]["labels"] or []
-
-            # Add new label if not exists
-            if label not in current_labels:
-                current_labels.append(label)
-                client.update_issue_field(issue_key, {"labels": current_labels})
+            # Single PUT with the "add" verb: idempotent, no read-modify-write
+            client.edit_issue(issue_key, {"labels": [{"add": label}]})
 
             return {"issue_key": issue_key, "label": label, "added": True}
 
@@ -1,19 +1,72 @@
 """PM layer service using Calendar and Jira APIs."""
 
-from datetime import datetime
+import asyncio
+from collections import Counter, defaultdict
+from datetime import date, datetime
 from typing import Any
 
+from cachetools import TTLCache
+
 from pm_mcp.config import Settings
 from pm_mcp.core.errors import PmError
 from pm_mcp.services.base import BaseService
 
+# Max concurrent Jira label updates per link call (Jira rate limits)
+LABEL_UPDATE_CONCURRENCY = 10
+
+# Jira fields needed by get_project_snapshot aggregation
+SNAPSHOT_ISSUE_FIELDS = "status,assignee,duedate"
+
+# Short-lived cache for repeated meeting lookups (invalidated on link)
+MEETING_CACHE_SIZE = 1024
+MEETING_CACHE_TTL = 30  # seconds
+
+
+def _aggregate_issues(issues: list[dict[str, Any]], today: date) -> dict[str, Any]:
+    """Count issues by status category, overdue and assignee."""
+    status_counts: defaultdict[str, int] = defaultdict(int)
+    total_overdue = 0
+    by_assignee: Counter[str] = Counter()
+
+    # Jira duedate is YYYY-MM-DD, so ISO strings compare chronologically
+    today_iso = today.isoformat()
+
+    for issue in issues:
+        status_category = issue.get("status_category") or ""
+        status_counts[status_category] += 1
+
+        # Check overdue
+        due_date = issue.get("due_date")
+        if due_date and status_category != "Done" and due_date[:10] < today_iso:
+            total_overdue += 1
+
+        # Count by assignee
+        by_assignee[issue.get("assignee") or "Unassigned"] += 1
+
+    return {
+        "total_open": status_counts["To Do"],
+        "total_in_progress": status_counts["In Progress"],
+        "total_done": status_counts["Done"],
+        "total_overdue": total_overdue,
+        "by_assignee": dict(by_assignee),
+    }
+
 
 class PmService(BaseService):
     """Service for PM layer using Calendar API + Jira labels (no database)."""
 
     def __init__(self, settings: Settings | None = None) -> None:
         super().__init__(settings)
-        # db_pool больше не нужен!
+        self._meeting_cache: TTLCache[tuple[str, str], dict[str, Any]] = TTLCache(
+            maxsize=MEETING_CACHE_SIZE, ttl=MEETING_CACHE_TTL
+        )
+        # Bumped on every link; a lookup that overlapped one may have read
+        # old metadata, so it is returned but not cached
+        self._meeting_cache_generation = 0
+
+    def clear_cache(self) -> None:
+        """Drop all cached meeting lookups."""
+        self._meeting_cache.clear()
 
     async def link_meeting_issues(
         self,
@@ -26,8 +79,13 @@ class PmService(BaseService):
         meeting_title: str | None = None,  # Игнорируется - берется из Calendar
         meeting_date: datetime | None = None,  # Игнорируется - берется из Calendar
         project_key: str | None = None,
+        label_semaphore: asyncio.Semaphore | None = None,
     ) -> dict[str, Any]:
-        """Link meeting to issues using Calendar + Jira labels for bidirectional lookup."""
+        """Link meeting to issues using Calendar + Jira labels for bidirectional lookup.
+
+        label_semaphore bounds concurrent Jira label updates; pass one shared
+        semaphore to bound several links together (default: per call).
+        """
         try:
             # Step 1: Update Calendar event with issue keys (meeting → issues)
             await calendar_service.update_event_metadata(
@@ -37,19 +95,30 @@ class PmService(BaseService):
                 confluence_page_id=confluence_page_id,
                 project_key=project_key,
             )
+            self._meeting_cache.pop((calendar_id, meeting_id), None)
+            self._meeting_cache_generation += 1
 
             # Step 2: Add gcal:meeting_id labels to each Jira issue (issue → meetings)
-            errors = []
-            for issue_key in issue_keys:
-                try:
+            semaphore = label_semaphore or asyncio.Semaphore(LABEL_UPDATE_CONCURRENCY)
+
+            async def add_label(issue_key: str) -> None:
+                async with semaphore:
                     await jira_service.add_meeting_label(
                         issue_key=issue_key,
                         meeting_id=meeting_id,
                     )
-                except Exception as e:
-                    # Log error but continue with other issues
-                    self._log_error(f"add_label_{issue_key}", e)
-                    errors.append({"issue": issue_key, "error": str(e)})
+
+            results = await asyncio.gather(
+                *(add_label(issue_key) for issue_key in issue_keys),
+                return_exceptions=True,
+            )
+
+            errors = []
+            for issue_key, outcome in zip(issue_keys, results):
+                if isinstance(outcome, Exception):
+                    # Log error but keep results for other issues
+                    self._log_error(f"add_label_{issue_key}", outcome)
+                    errors.append({"issue": issue_key, "error": str(outcome)})
 
             # Return result with potential errors
             result = {
@@ -69,6 +138,40 @@ class PmService(BaseService):
                 details={"meeting_id": meeting_id},
             ) from e
 
+    async def link_meetings_batch(
+        self,
+        calendar_service: Any,  # CalendarService
+        jira_service: Any,  # JiraService for labels
+        calendar_id: str,
+        items: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Link several meetings concurrently.
+
+        Each item carries link_meeting_issues arguments (meeting_id,
+        issue_keys and optional confluence_page_id/project_key). Failed
+        items are returned with an "error" key instead of aborting the batch.
+        Jira label updates of the whole batch share one semaphore.
+        """
+        label_semaphore = asyncio.Semaphore(LABEL_UPDATE_CONCURRENCY)
+
+        async def link(item: dict[str, Any]) -> dict[str, Any]:
+            try:
+                return await self.link_meeting_issues(
+                    calendar_service=calendar_service,
+                    jira_service=jira_service,
+                    calendar_id=calendar_id,
+                    meeting_id=item["meeting_id"],
+                    issue_keys=item["issue_keys"],
+                    confluence_page_id=item.get("confluence_page_id"),
+                    project_key=item.get("project_key"),
+                    label_semaphore=label_semaphore,
+                )
+            except Exception as e:  # noqa: BLE001 - reported per item
+                self._log_error("link_meetings_batch", e)
+                return {"meeting_id": item.get("meeting_id"), "error": str(e)}
+
+        return list(await asyncio.gather(*(link(item) for item in items)))
+
     async def get_meeting_issues(
         self,
         calendar_service: Any,  # CalendarService
@@ -76,8 +179,17 @@ class PmService(BaseService):
         meeting_id: str,
     ) -> dict[str, Any]:
         """Get issues linked to meeting from Calendar."""
+        cache_key = (calendar_id, meeting_id)
+        cached = self._meeting_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        generation = self._meeting_cache_generation
         try:
-            return await calendar_service.get_event_metadata(calendar_id, meeting_id)
+            result = await calendar_service.get_event_metadata(calendar_id, meeting_id)
+            if generation == self._meeting_cache_generation:
+                self._meeting_cache[cache_key] = result
+            return result
 
         except Exception as e:
             self._log_error("get_meeting_issues", e)
@@ -94,52 +206,16 @@ class PmService(BaseService):
     ) -> dict[str, Any]:
         """Get aggregated project statistics."""
         try:
-            # Get issues from Jira
+            # Get issues from Jira (only the fields the aggregation reads)
             all_issues = await jira_service.list_issues(
                 project_key=project_key,
                 max_results=500,
+                fields=SNAPSHOT_ISSUE_FIELDS,
             )
 
-            # Calculate statistics
-            total_open = 0
-            total_in_progress = 0
-            total_done = 0
-            total_overdue = 0
-            by_assignee: dict[str, int] = {}
-
-            today = datetime.now().date()
-
-            for issue in all_issues:
-                status_category = issue.get("status_category", "")
-
-                if status_category == "To Do":
-                    total_open += 1
-                elif status_category == "In Progress":
-                    total_in_progress += 1
-                elif status_category == "Done":
-                    total_done += 1
-
-                # Check overdue
-                due_date = issue.get("due_date")
-                if due_date and status_category != "Done":
-                    try:
-                        due = datetime.fromisoformat(due_date).date()
-                        if due < today:
-                            total_overdue += 1
-                    except (ValueError, TypeError):
-                        pass
-
-                # Count by assignee
-                assignee = issue.get("assignee") or "Unassigned"
-                by_assignee[assignee] = by_assignee.get(assignee, 0) + 1
-
             return {
                 "project_key": project_key,
-                "total_open": total_open,
-                "total_in_progress": total_in_progress,
-                "total_done": total_done,
-                "total_overdue": total_overdue,
-                "by_assignee": by_assignee,
+                **_aggregate_issues(all_issues, date.today()),
             }
 
         except Exception as e:
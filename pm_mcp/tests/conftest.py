@@ -1,62 +1,108 @@
 """Pytest fixtures for MCP server tests."""
 
-from typing import AsyncGenerator, Generator
+from typing import TYPE_CHECKING, AsyncGenerator, Generator
 
 import pytest
-from fastmcp import Client, FastMCP
+import pytest_asyncio
 
-from pm_mcp.services.pm_service import PmService
 from pm_mcp.tests.mocks.mock_services import (
     MockCalendarService,
     MockConfluenceService,
     MockJiraService,
 )
-from pm_mcp.tools.calendar import register_calendar_tools
-from pm_mcp.tools.confluence import register_confluence_tools
-from pm_mcp.tools.jira import register_jira_tools
-from pm_mcp.tools.pm import register_pm_tools
 
+if TYPE_CHECKING:
+    # Heavy imports are deferred to the fixtures that need them
+    from fastmcp import Client, FastMCP
 
-@pytest.fixture
-def mock_calendar_service() -> MockCalendarService:
-    """Create mock calendar service."""
+    from pm_mcp.services.pm_service import PmService
+
+
+@pytest.fixture(scope="session")
+def _calendar_service_instance() -> MockCalendarService:
+    """Single mock calendar service shared by the session."""
     return MockCalendarService()
 
 
 @pytest.fixture
-def mock_jira_service() -> MockJiraService:
-    """Create mock Jira service."""
+def mock_calendar_service(
+    _calendar_service_instance: MockCalendarService,
+) -> MockCalendarService:
+    """Mock calendar service reset to its initial state."""
+    _calendar_service_instance.reset()
+    return _calendar_service_instance
+
+
+@pytest.fixture(scope="session")
+def _jira_service_instance() -> MockJiraService:
+    """Single mock Jira service shared by the session."""
     return MockJiraService()
 
 
 @pytest.fixture
-def mock_confluence_service() -> MockConfluenceService:
-    """Create mock Confluence service."""
+def mock_jira_service(_jira_service_instance: MockJiraService) -> MockJiraService:
+    """Mock Jira service reset to its initial state."""
+    _jira_service_instance.reset()
+    return _jira_service_instance
+
+
+@pytest.fixture(scope="session")
+def _confluence_service_instance() -> MockConfluenceService:
+    """Single mock Confluence service shared by the session."""
     return MockConfluenceService()
 
 
 @pytest.fixture
-def mock_pm_service() -> PmService:
-    """Create PM service."""
+def mock_confluence_service(
+    _confluence_service_instance: MockConfluenceService,
+) -> MockConfluenceService:
+    """Mock Confluence service reset to its initial state."""
+    _confluence_service_instance.reset()
+    return _confluence_service_instance
+
+
+@pytest.fixture(scope="session")
+def _pm_service_instance() -> "PmService":
+    """Single PM service shared by the session."""
+    from pm_mcp.services.pm_service import PmService
+
     return PmService()
 
 
 @pytest.fixture
+def mock_pm_service(_pm_service_instance: "PmService") -> "PmService":
+    """PM service with an empty meeting cache."""
+    _pm_service_instance.clear_cache()
+    return _pm_service_instance
+
+
+@pytest.fixture(scope="session")
 def mcp_server(
-    mock_calendar_service: MockCalendarService,
-    mock_jira_service: MockJiraService,
-    mock_confluence_service: MockConfluenceService,
-    mock_pm_service: PmService,
-) -> Generator[FastMCP, None, None]:
-    """Create MCP server with mocked services attached to mcp instance."""
+    _calendar_service_instance: MockCalendarService,
+    _jira_service_instance: MockJiraService,
+    _confluence_service_instance: MockConfluenceService,
+    _pm_service_instance: "PmService",
+) -> Generator["FastMCP", None, None]:
+    """Create MCP server with mocked services attached to mcp instance.
+
+    Built once per session; the mock services are reset per test by the
+    function-scoped mock_* fixtures that mcp_client depends on.
+    """
+    from fastmcp import FastMCP
+
+    from pm_mcp.tools.calendar import register_calendar_tools
+    from pm_mcp.tools.confluence import register_confluence_tools
+    from pm_mcp.tools.jira import register_jira_tools
+    from pm_mcp.tools.pm import register_pm_tools
+
     mcp = FastMCP(name="test-pm-mcp")
 
     # Attach mock services directly to mcp instance
     # (same pattern as production code in server.py)
-    mcp.jira_service = mock_jira_service  # type: ignore[attr-defined]
-    mcp.confluence_service = mock_confluence_service  # type: ignore[attr-defined]
-    mcp.calendar_service = mock_calendar_service  # type: ignore[attr-defined]
-    mcp.pm_service = mock_pm_service  # type: ignore[attr-defined]
+    mcp.jira_service = _jira_service_instance  # type: ignore[attr-defined]
+    mcp.confluence_service = _confluence_service_instance  # type: ignore[attr-defined]
+    mcp.calendar_service = _calendar_service_instance  # type: ignore[attr-defined]
+    mcp.pm_service = _pm_service_instance  # type: ignore[attr-defined]
 
     # Register tools (they will access services via ctx.fastmcp)
     register_calendar_tools(mcp)
@@ -67,8 +113,24 @@ def mcp_server(
     yield mcp
 
 
-@pytest.fixture
-async def mcp_client(mcp_server: FastMCP) -> AsyncGenerator[Client, None]:
-    """Create MCP client connected to test server."""
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _mcp_client_session(
+    mcp_server: "FastMCP",
+) -> AsyncGenerator["Client", None]:
+    """Single MCP client connection shared by the session."""
+    from fastmcp import Client
+
     async with Client(mcp_server) as client:
         yield client
+
+
+@pytest.fixture
+def mcp_client(
+    _mcp_client_session: "Client",
+    mock_calendar_service: MockCalendarService,
+    mock_jira_service: MockJiraService,
+    mock_confluence_service: MockConfluenceService,
+    mock_pm_service: "PmService",
+) -> "Client":
+    """MCP client connected to test server, with mock services reset."""
+    return _mcp_client_session
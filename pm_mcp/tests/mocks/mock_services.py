@@ -1,84 +1,256 @@
 """Mock implementations of services for testing."""
 
+import inspect
 import json
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Any
-from unittest.mock import AsyncMock
-
-
-class MockCalendarService:
-    """Mock Google Calendar service with extendedProperties support."""
-
-    def __init__(self) -> None:
-        self.list_events = AsyncMock(side_effect=self._list_events)
-        self.update_event_metadata = AsyncMock(side_effect=self._update_event_metadata)
-        self.get_event_metadata = AsyncMock(side_effect=self._get_event_metadata)
-        self.list_calendars = AsyncMock(side_effect=self._list_calendars)
-        self.find_or_create_project_calendar = AsyncMock(
-            side_effect=self._find_or_create_project_calendar
-        )
-        self.create_project_calendar = AsyncMock(
-            side_effect=self._create_project_calendar
-        )
-
-        # In-memory storage: event_id -> extendedProperties.private
-        self._events_metadata: dict[str, dict[str, Any]] = {}
-
-        # Mock events data (for get_event_metadata)
-        self._events: dict[str, dict[str, Any]] = {
-            "event1": {
+from unittest.mock import AsyncMock, call
+
+# Read-only default fixtures, built once at import (copy before mutating)
+_DEFAULT_EVENTS = (
+    MappingProxyType(
+        {
+            "id": "event1",
+            "summary": "Sprint Planning",
+            "description": "Weekly sprint planning meeting",
+            "start": "2024-01-15T10:00:00+00:00",
+            "end": "2024-01-15T11:00:00+00:00",
+            "location": "Room A",
+            "attendees": ("alice@example.com", "bob@example.com"),
+        }
+    ),
+    MappingProxyType(
+        {
+            "id": "event2",
+            "summary": "Retrospective",
+            "description": None,
+            "start": "2024-01-16T14:00:00+00:00",
+            "end": "2024-01-16T15:00:00+00:00",
+            "location": None,
+            "attendees": None,
+        }
+    ),
+)
+
+# Raw events as returned by the Calendar API (for get_event_metadata)
+_DEFAULT_EVENT_DETAILS = (
+    (
+        "event1",
+        MappingProxyType(
+            {
                 "id": "event1",
                 "summary": "Sprint Planning",
-                "start": {"dateTime": "2024-01-15T10:00:00+00:00"},
-            },
-            "event2": {
+                "start": MappingProxyType({"dateTime": "2024-01-15T10:00:00+00:00"}),
+            }
+        ),
+    ),
+    (
+        "event2",
+        MappingProxyType(
+            {
                 "id": "event2",
                 "summary": "Retrospective",
-                "start": {"dateTime": "2024-01-16T14:00:00+00:00"},
-            },
-        }
-
-        # Mock calendars storage: calendar_id -> calendar data
-        self._calendars: dict[str, dict[str, Any]] = {
-            "calendar_alpha": {
+                "start": MappingProxyType({"dateTime": "2024-01-16T14:00:00+00:00"}),
+            }
+        ),
+    ),
+)
+
+_DEFAULT_CALENDARS = (
+    (
+        "calendar_alpha",
+        MappingProxyType(
+            {
                 "calendar_id": "calendar_alpha",
                 "name": "ALPHA",
                 "description": "jira_project_key=ALPHA\nconfluence_space_key=ALPHA",
                 "primary": False,
                 "jira_project_key": "ALPHA",
                 "confluence_space_key": "ALPHA",
-            },
-            "calendar_beta": {
+            }
+        ),
+    ),
+    (
+        "calendar_beta",
+        MappingProxyType(
+            {
                 "calendar_id": "calendar_beta",
                 "name": "BETA",
                 "description": "jira_project_key=BETA",
                 "primary": False,
                 "jira_project_key": "BETA",
                 "confluence_space_key": None,
-            },
+            }
+        ),
+    ),
+)
+
+_DEFAULT_ISSUES = (
+    MappingProxyType(
+        {
+            "key": "PROJ-1",
+            "id": "10001",
+            "url": "https://jira.example.com/browse/PROJ-1",
+            "summary": "Implement feature X",
+            "status": "In Progress",
+            "status_category": "In Progress",
+            "assignee": "Alice",
+            "labels": ("backend",),
+            "due_date": "2024-01-20",
+            "updated": "2024-01-15T10:00:00+00:00",
         }
-        self._calendar_counter = 0
+    ),
+    MappingProxyType(
+        {
+            "key": "PROJ-2",
+            "id": "10002",
+            "url": "https://jira.example.com/browse/PROJ-2",
+            "summary": "Fix bug Y",
+            "status": "To Do",
+            "status_category": "To Do",
+            "assignee": None,
+            "labels": (),
+            "due_date": None,
+            "updated": "2024-01-14T09:00:00+00:00",
+        }
+    ),
+)
 
-    def _default_events(self) -> list[dict[str, Any]]:
-        return [
-            {
-                "id": "event1",
-                "summary": "Sprint Planning",
-                "description": "Weekly sprint planning meeting",
-                "start": "2024-01-15T10:00:00+00:00",
-                "end": "2024-01-15T11:00:00+00:00",
-                "location": "Room A",
-                "attendees": ["alice@example.com", "bob@example.com"],
-            },
-            {
-                "id": "event2",
-                "summary": "Retrospective",
-                "description": None,
-                "start": "2024-01-16T14:00:00+00:00",
-                "end": "2024-01-16T15:00:00+00:00",
-                "location": None,
-                "attendees": None,
-            },
-        ]
+
+_DEFAULT_PAGES = (
+    MappingProxyType(
+        {
+            "id": "123456",
+            "title": "Sprint 10 Planning Notes",
+            "url": "https://confluence.example.com/pages/viewpage.action?pageId=123456",
+            "space_key": "TEAM",
+            "last_modified": "2024-01-15T10:30:00+00:00",
+        }
+    ),
+)
+
+_DEFAULT_PAGE_CONTENT = MappingProxyType(
+    {
+        "id": "123456",
+        "title": "Sprint 10 Planning Notes",
+        "url": "https://confluence.example.com/pages/viewpage.action?pageId=123456",
+        "body_text": """Sprint 10 Planning Notes
+
+Attendees: Alice, Bob, Charlie
+
+Action Items:
+1. Alice: Complete API documentation by Friday
+2. Bob: Review pull request #123
+3. Charlie: Setup staging environment
+
+Decisions:
+- Use PostgreSQL for the new service
+- Deploy to production next Monday
+""",
+    }
+)
+
+_DEFAULT_CREATED_PAGE = MappingProxyType(
+    {
+        "id": "789012",
+        "title": "New Meeting Notes",
+        "url": "https://confluence.example.com/pages/viewpage.action?pageId=789012",
+    }
+)
+
+
+class _CountingAsyncMock:
+    """Lightweight stand-in for AsyncMock(side_effect=func).
+
+    Counts calls and records arguments only when record=True, skipping
+    AsyncMock's child-mock and call-tracking machinery. func may be a plain
+    function (in-memory lookups) or a coroutine function; either way the
+    mock itself is awaited like the real async service method.
+    """
+
+    def __init__(self, func: Callable[..., Any], record: bool = False) -> None:
+        self._func = func
+        self._is_async = inspect.iscoroutinefunction(func)
+        self._record = record
+        self.call_count = 0
+        self.call_args_list: list[Any] = []
+
+    @property
+    def called(self) -> bool:
+        return self.call_count > 0
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.call_count += 1
+        if self._record:
+            self.call_args_list.append(call(*args, **kwargs))
+        result = self._func(*args, **kwargs)
+        if self._is_async:
+            result = await result
+        return result
+
+    def assert_called_once(self) -> None:
+        assert self.call_count == 1, f"Expected 1 call, got {self.call_count}"
+
+    def assert_called_once_with(self, *args: Any, **kwargs: Any) -> None:
+        assert self._record, "Call arguments are not recorded (record=False)"
+        self.assert_called_once()
+        assert self.call_args_list[0] == call(*args, **kwargs)
+
+    def reset_mock(self) -> None:
+        self.call_count = 0
+        self.call_args_list.clear()
+
+
+class MockCalendarService:
+    """Mock Google Calendar service with extendedProperties support."""
+
+    def __init__(self) -> None:
+        # AsyncMock only where tests override return values or inspect calls
+        self.list_events = AsyncMock()
+        self.list_calendars = AsyncMock()
+        self.find_or_create_project_calendar = AsyncMock()
+        self.update_event_metadata = _CountingAsyncMock(self._update_event_metadata)
+        self.get_event_metadata = _CountingAsyncMock(self._get_event_metadata)
+        self.create_project_calendar = _CountingAsyncMock(self._create_project_calendar)
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore initial state so one instance can be reused across tests."""
+        for mock, side_effect in (
+            (self.list_events, self._list_events),
+            (self.list_calendars, self._list_calendars),
+            (
+                self.find_or_create_project_calendar,
+                self._find_or_create_project_calendar,
+            ),
+        ):
+            mock.reset_mock(return_value=True, side_effect=True)
+            mock.side_effect = side_effect
+        for counter in (
+            self.update_event_metadata,
+            self.get_event_metadata,
+            self.create_project_calendar,
+        ):
+            counter.reset_mock()
+
+        # In-memory storage: event_id -> extendedProperties.private
+        self._events_metadata: dict[str, dict[str, Any]] = {}
+
+        # Mock events data (for get_event_metadata)
+        self._events: dict[str, dict[str, Any]] = {
+            event_id: dict(event) for event_id, event in _DEFAULT_EVENT_DETAILS
+        }
+
+        # Mock calendars storage: calendar_id -> calendar data
+        self._calendars: dict[str, dict[str, Any]] = {
+            calendar_id: dict(calendar) for calendar_id, calendar in _DEFAULT_CALENDARS
+        }
+        # Secondary index: calendar name -> calendar (same dict objects)
+        self._calendars_by_name: dict[str, dict[str, Any]] = {
+            calendar["name"]: calendar for calendar in self._calendars.values()
+        }
+        self._calendar_counter = 0
 
     def set_event(self, event_id: str, summary: str, start_datetime: str) -> None:
         """Set mock event data."""
@@ -95,9 +267,10 @@ class MockCalendarService:
         time_max: Any = None,
         text_query: str | None = None,
         max_results: int = 50,
-    ) -> list[dict[str, Any]]:
-        """Mock list events with calendar_id parameter."""
-        return self._default_events()
+        page_token: str | None = None,
+    ) -> dict[str, Any]:
+        """Mock list events with calendar_id parameter (single page)."""
+        return {"events": list(_DEFAULT_EVENTS), "next_page_token": None}
 
     async def _update_event_metadata(
         self,
@@ -107,10 +280,12 @@ class MockCalendarService:
         confluence_page_id: str | None = None,
         project_key: str | None = None,
     ) -> dict[str, Any]:
-        """Mock update event metadata."""
-        metadata = {
-            "jiraIssues": json.dumps(jira_issues),
-        }
+        """Mock update event metadata.
+
+        Issue keys are stored as a list; only the returned event carries the
+        JSON-encoded jiraIssues value the real API would echo back.
+        """
+        metadata: dict[str, Any] = {"jiraIssues": list(jira_issues)}
         if confluence_page_id:
             metadata["confluencePageId"] = confluence_page_id
         if project_key:
@@ -118,18 +293,21 @@ class MockCalendarService:
 
         self._events_metadata[event_id] = metadata
 
-        return {"id": event_id, "extendedProperties": {"private": metadata}}
+        return {
+            "id": event_id,
+            "extendedProperties": {
+                "private": {**metadata, "jiraIssues": json.dumps(jira_issues)}
+            },
+        }
 
-    async def _get_event_metadata(
-        self, calendar_id: str, event_id: str
-    ) -> dict[str, Any]:
+    def _get_event_metadata(self, calendar_id: str, event_id: str) -> dict[str, Any]:
         """Mock get event metadata."""
         private_props = self._events_metadata.get(event_id, {})
         event_data = self._events.get(event_id, {})
 
         return {
             "meeting_id": event_id,
-            "issue_keys": json.loads(private_props.get("jiraIssues", "[]")),
+            "issue_keys": list(private_props.get("jiraIssues", ())),
             "confluence_page_id": private_props.get("confluencePageId"),
             "project_key": private_props.get("projectKey"),
             "meeting_title": event_data.get("summary"),
@@ -165,6 +343,7 @@ class MockCalendarService:
         }
 
         self._calendars[calendar_id] = calendar
+        self._calendars_by_name[project_key] = calendar
         return calendar
 
     async def _find_or_create_project_calendar(
@@ -173,11 +352,10 @@ class MockCalendarService:
         confluence_space_key: str | None = None,
     ) -> dict[str, Any]:
         """Mock find or create calendar for project."""
-        # Search by name
-        for calendar in self._calendars.values():
-            if calendar["name"] == project_key:
-                calendar["created"] = False
-                return calendar
+        calendar = self._calendars_by_name.get(project_key)
+        if calendar is not None:
+            calendar["created"] = False
+            return calendar
 
         # Not found -> create
         return await self._create_project_calendar(project_key, confluence_space_key)
@@ -199,37 +377,35 @@ class MockJiraService:
         self.add_comment = AsyncMock(
             return_value={"issue_key": "PROJ-1", "comment_id": "10001"}
         )
-        self.get_issue = AsyncMock(side_effect=self._get_issue)
+        self.get_issue = _CountingAsyncMock(self._get_issue)
+        self.get_issues_by_keys = _CountingAsyncMock(self._get_issues_by_keys)
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore initial state so one instance can be reused across tests."""
+        for mock in (
+            self.list_issues,
+            self.create_issue,
+            self.create_issues_batch,
+            self.update_issue,
+            self.add_comment,
+            self.get_issue,
+            self.get_issues_by_keys,
+        ):
+            mock.reset_mock()
+        self.list_issues.return_value = self._default_issues()
         self._issue_counter = 0
         self._issues_by_key = {issue["key"]: issue for issue in self._default_issues()}
 
+        # Secondary index: label -> issues carrying it (for find_issues_by_meeting)
+        self._issues_by_label: dict[str, list[dict[str, Any]]] = {}
+        for issue in self._issues_by_key.values():
+            for label in issue["labels"]:
+                self._issues_by_label.setdefault(label, []).append(issue)
+
     def _default_issues(self) -> list[dict[str, Any]]:
-        return [
-            {
-                "key": "PROJ-1",
-                "id": "10001",
-                "url": "https://jira.example.com/browse/PROJ-1",
-                "summary": "Implement feature X",
-                "status": "In Progress",
-                "status_category": "In Progress",
-                "assignee": "Alice",
-                "labels": ["backend"],
-                "due_date": "2024-01-20",
-                "updated": "2024-01-15T10:00:00+00:00",
-            },
-            {
-                "key": "PROJ-2",
-                "id": "10002",
-                "url": "https://jira.example.com/browse/PROJ-2",
-                "summary": "Fix bug Y",
-                "status": "To Do",
-                "status_category": "To Do",
-                "assignee": None,
-                "labels": [],
-                "due_date": None,
-                "updated": "2024-01-14T09:00:00+00:00",
-            },
-        ]
+        # Labels are mutated by add/remove_meeting_label, so copy them
+        return [{**issue, "labels": list(issue["labels"])} for issue in _DEFAULT_ISSUES]
 
     def _create_issue(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
         self._issue_counter += 1
@@ -252,15 +428,21 @@ class MockJiraService:
         """Get issue by key from mock data."""
         return self._issues_by_key.get(issue_key)
 
+    def _get_issues_by_keys(self, issue_keys: list[str]) -> list[dict[str, Any]]:
+        """Get the issues that exist among issue_keys from mock data."""
+        return [
+            self._issues_by_key[key] for key in issue_keys if key in self._issues_by_key
+        ]
+
     async def add_meeting_label(
         self, issue_key: str, meeting_id: str
     ) -> dict[str, Any]:
         """Mock add meeting label."""
         label = f"gcal:{meeting_id}"
         issue = self._issues_by_key.get(issue_key)
-        if issue:
-            if label not in issue["labels"]:
-                issue["labels"].append(label)
+        if issue and label not in issue["labels"]:
+            issue["labels"].append(label)
+            self._issues_by_label.setdefault(label, []).append(issue)
         return {"issue_key": issue_key, "label": label, "added": True}
 
     async def remove_meeting_label(
@@ -271,6 +453,7 @@ class MockJiraService:
         issue = self._issues_by_key.get(issue_key)
         if issue and label in issue["labels"]:
             issue["labels"].remove(label)
+            self._issues_by_label[label].remove(issue)
             return {"issue_key": issue_key, "label": label, "removed": True}
         return {"issue_key": issue_key, "label": label, "removed": False}
 
@@ -278,13 +461,10 @@ class MockJiraService:
         self, meeting_id: str, project_key: str | None = None
     ) -> list[dict[str, Any]]:
         """Mock find issues by meeting."""
-        label = f"gcal:{meeting_id}"
-        results = []
-        for issue in self._issues_by_key.values():
-            if label in issue["labels"]:
-                if project_key is None or issue["key"].startswith(project_key):
-                    results.append(issue)
-        return results
+        issues = self._issues_by_label.get(f"gcal:{meeting_id}", [])
+        if project_key is None:
+            return list(issues)
+        return [issue for issue in issues if issue["key"].startswith(project_key)]
 
 
 class MockConfluenceService:
@@ -295,40 +475,21 @@ class MockConfluenceService:
         self.get_page_content = AsyncMock(return_value=self._default_page_content())
         self.create_page = AsyncMock(return_value=self._default_created_page())
 
-    def _default_pages(self) -> list[dict[str, Any]]:
-        return [
-            {
-                "id": "123456",
-                "title": "Sprint 10 Planning Notes",
-                "url": "https://confluence.example.com/pages/viewpage.action?pageId=123456",
-                "space_key": "TEAM",
-                "last_modified": "2024-01-15T10:30:00+00:00",
-            },
-        ]
-
-    def _default_page_content(self) -> dict[str, Any]:
-        return {
-            "id": "123456",
-            "title": "Sprint 10 Planning Notes",
-            "url": "https://confluence.example.com/pages/viewpage.action?pageId=123456",
-            "body_text": """Sprint 10 Planning Notes
-
-Attendees: Alice, Bob, Charlie
+    def reset(self) -> None:
+        """Restore initial state so one instance can be reused across tests."""
+        for mock, default in (
+            (self.search_pages, self._default_pages()),
+            (self.get_page_content, self._default_page_content()),
+            (self.create_page, self._default_created_page()),
+        ):
+            mock.reset_mock()
+            mock.return_value = default
 
-Action Items:
-1. Alice: Complete API documentation by Friday
-2. Bob: Review pull request #123
-3. Charlie: Setup staging environment
+    def _default_pages(self) -> list[Mapping[str, Any]]:
+        return list(_DEFAULT_PAGES)
 
-Decisions:
-- Use PostgreSQL for the new service
-- Deploy to production next Monday
-""",
-        }
+    def _default_page_content(self) -> Mapping[str, Any]:
+        return _DEFAULT_PAGE_CONTENT
 
-    def _default_created_page(self) -> dict[str, Any]:
-        return {
-            "id": "789012",
-            "title": "New Meeting Notes",
-            "url": "https://confluence.example.com/pages/viewpage.action?pageId=789012",
-        }
+    def _default_created_page(self) -> Mapping[str, Any]:
+        return _DEFAULT_CREATED_PAGE
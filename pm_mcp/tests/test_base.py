@@ -0,0 +1,27 @@
+"""Tests for shared service helpers."""
+
+import pytest
+
+from pm_mcp.services.base import escape_query_value
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        pytest.param("", "", id="empty"),
+        pytest.param(
+            "Sprint planning: Q1 && review",
+            "Sprint planning: Q1 && review",
+            id="plain",
+        ),
+        pytest.param("test + value", "test + value", id="plus"),
+        pytest.param("a || !b ~ c*?", "a || !b ~ c*?", id="jql-operators"),
+        pytest.param('say "hi"', 'say \\"hi\\"', id="double-quotes"),
+        pytest.param("it's", "it\\'s", id="single-quote"),
+        pytest.param("C:\\path", "C:\\\\path", id="backslash"),
+        pytest.param('\\"', '\\\\\\"', id="backslash-before-quote"),
+    ],
+)
+def test_escape_query_value(value: str, expected: str) -> None:
+    """Test escaping of user values for quoted JQL/CQL strings."""
+    assert escape_query_value(value) == expected
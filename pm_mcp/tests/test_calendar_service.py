@@ -0,0 +1,177 @@
+"""Tests for CalendarService."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pm_mcp.config import Settings
+from pm_mcp.services.calendar_service import (
+    CalendarService,
+    _parse_calendar_description,
+)
+
+
+@pytest.fixture(scope="module")
+def calendar_service() -> CalendarService:
+    """CalendarService shared by the module (helpers only, no API client)."""
+    return CalendarService()
+
+
+@pytest.mark.parametrize(
+    ("description", "expected"),
+    [
+        pytest.param(None, (None, None), id="none"),
+        pytest.param("", (None, None), id="empty"),
+        pytest.param(
+            "jira_project_key=ALPHA\nconfluence_space_key=ALPHA_SPACE",
+            ("ALPHA", "ALPHA_SPACE"),
+            id="both-keys",
+        ),
+        pytest.param(
+            "  jira_project_key = BETA  \n\nnotes: weekly sync\nunknown=1",
+            ("BETA", None),
+            id="whitespace-and-noise",
+        ),
+        pytest.param(
+            "jira_project_key=GAMMA\r\nconfluence_space_key=G\r\n",
+            ("GAMMA", "G"),
+            id="crlf",
+        ),
+        pytest.param(
+            "jira_project_key_old=X\njira_project_key=A\njira_project_key=B",
+            ("B", None),
+            id="exact-key-last-wins",
+        ),
+        pytest.param(
+            "confluence_space_key=a=b",
+            (None, "a=b"),
+            id="value-with-equals",
+        ),
+    ],
+)
+def test_parse_calendar_description(
+    description: str | None, expected: tuple[str | None, str | None]
+) -> None:
+    """Test parsing calendar metadata from description."""
+    assert _parse_calendar_description(description) == expected
+
+
+def test_parse_calendar_metadata_returns_fresh_dict(
+    calendar_service: CalendarService,
+) -> None:
+    """Test cached parsing still hands out independent dicts."""
+    description = "jira_project_key=ALPHA"
+
+    first = calendar_service._parse_calendar_metadata(description)
+    first["jira_project_key"] = "CHANGED"
+    second = calendar_service._parse_calendar_metadata(description)
+
+    assert second == {"jira_project_key": "ALPHA", "confluence_space_key": None}
+
+
+def test_list_events_sends_timezone_aware_range() -> None:
+    """Test naive bounds are sent as UTC and aware bounds keep their offset."""
+    service = CalendarService()
+    client = MagicMock()
+    client.events().list().execute.return_value = {"items": []}
+    client.events().list.reset_mock()
+    plus_three = timezone(timedelta(hours=3))
+
+    with patch.object(service, "_get_service", return_value=client):
+        service._list_events_sync(
+            "cal-alpha",
+            time_min=datetime(2026, 3, 1, 9, 0),
+            time_max=datetime(2026, 3, 2, 9, 0, tzinfo=plus_three),
+        )
+
+    params = client.events().list.call_args.kwargs
+    assert params["timeMin"] == "2026-03-01T09:00:00+00:00"
+    assert params["timeMax"] == "2026-03-02T09:00:00+03:00"
+
+
+async def test_find_or_create_project_calendar_cached() -> None:
+    """Test repeat project calendar lookups skip the Calendar API."""
+    service = CalendarService()
+    calendar = {
+        "calendar_id": "cal-alpha",
+        "name": "ALPHA",
+        "description": "jira_project_key=ALPHA",
+        "primary": False,
+        "jira_project_key": "ALPHA",
+        "confluence_space_key": None,
+    }
+
+    with patch.object(
+        service, "_list_calendars_sync", return_value=[calendar]
+    ) as list_calendars:
+        first = await service.find_or_create_project_calendar(project_key="ALPHA")
+        second = await service.find_or_create_project_calendar(project_key="ALPHA")
+
+    list_calendars.assert_called_once()
+    assert first["calendar_id"] == second["calendar_id"] == "cal-alpha"
+    assert second["created"] is False
+
+    service.clear_cache()
+    with patch.object(
+        service, "_list_calendars_sync", return_value=[calendar]
+    ) as list_calendars:
+        await service.find_or_create_project_calendar(project_key="ALPHA")
+
+    list_calendars.assert_called_once()
+
+
+async def test_find_or_create_project_calendar_concurrent_single_lookup() -> None:
+    """Test concurrent lookups for one project share a single API lookup."""
+    service = CalendarService()
+    calendar = {
+        "calendar_id": "cal-beta",
+        "name": "BETA",
+        "description": "jira_project_key=BETA",
+        "primary": False,
+        "jira_project_key": "BETA",
+        "confluence_space_key": None,
+    }
+
+    with patch.object(
+        service, "_list_calendars_sync", return_value=[calendar]
+    ) as list_calendars:
+        results = await asyncio.gather(
+            *(
+                service.find_or_create_project_calendar(project_key="BETA")
+                for _ in range(5)
+            )
+        )
+
+    list_calendars.assert_called_once()
+    assert {result["calendar_id"] for result in results} == {"cal-beta"}
+    # Locks are released once the lookups finish
+    assert service._project_calendar_locks == {}
+
+
+async def test_api_calls_bounded_by_max_concurrency() -> None:
+    """Test concurrent Calendar API calls never exceed calendar_max_concurrency."""
+    service = CalendarService(Settings(calendar_max_concurrency=2))
+    lock = threading.Lock()
+    in_flight = peak = 0
+
+    def list_events_sync(*args: Any) -> dict[str, Any]:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return {"events": [], "next_page_token": None}
+
+    with patch.object(service, "_list_events_sync", side_effect=list_events_sync):
+        await asyncio.gather(
+            *(service.list_events(calendar_id=f"cal-{i}") for i in range(6))
+        )
+
+    assert peak == 2
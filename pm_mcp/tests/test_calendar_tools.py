@@ -1,20 +1,64 @@
 """Tests for calendar tools."""
 
+from typing import Any
+
 import pytest
 from fastmcp import Client
+from fastmcp.exceptions import ToolError
 
+from pm_mcp.core.errors import CalendarError
 from pm_mcp.tests.mocks.mock_services import MockCalendarService
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("arguments", "preset_page"),
+    [
+        pytest.param({"project_key": "ALPHA"}, None, id="defaults"),
+        pytest.param(
+            {
+                "project_key": "ALPHA",
+                "time_min": "2024-01-01T00:00:00Z",
+                "time_max": "2024-01-31T23:59:59Z",
+                "text_query": "sprint",
+                "max_results": 10,
+                "page_token": "page-1",
+            },
+            None,
+            id="with-params",
+        ),
+        pytest.param(
+            {"project_key": "ALPHA"},
+            {
+                "events": [
+                    {
+                        "id": "test-event-1",
+                        "summary": "Test Meeting",
+                        "description": "A test meeting",
+                        "start": "2024-01-15T10:00:00Z",
+                        "end": "2024-01-15T11:00:00Z",
+                        "location": "Room A",
+                        "attendees": ["user@example.com"],
+                    }
+                ],
+                "next_page_token": "page-2",
+            },
+            id="returns-events",
+        ),
+    ],
+)
 async def test_calendar_list_events(
     mcp_client: Client,
     mock_calendar_service: MockCalendarService,
+    arguments: dict[str, Any],
+    preset_page: dict[str, Any] | None,
 ) -> None:
     """Test listing calendar events."""
-    result = await mcp_client.call_tool(
-        "calendar_list_events", {"project_key": "ALPHA"}
-    )
+    if preset_page is not None:
+        mock_calendar_service.list_events.side_effect = None
+        mock_calendar_service.list_events.return_value = preset_page
+
+    result = await mcp_client.call_tool("calendar_list_events", arguments)
 
     assert result is not None
     # Check that service was called
@@ -22,94 +66,183 @@ async def test_calendar_list_events(
     mock_calendar_service.find_or_create_project_calendar.assert_called_once_with(
         project_key="ALPHA"
     )
+    assert mock_calendar_service.list_events.call_args.kwargs[
+        "page_token"
+    ] == arguments.get("page_token")
+    if preset_page is not None:
+        assert [e["id"] for e in result.structured_content["events"]] == [
+            "test-event-1"
+        ]
+        assert result.structured_content["next_page_token"] == "page-2"
 
 
 @pytest.mark.asyncio
-async def test_calendar_list_events_with_params(
+async def test_calendar_list_calendars(
     mcp_client: Client,
     mock_calendar_service: MockCalendarService,
 ) -> None:
-    """Test listing calendar events with parameters."""
-    result = await mcp_client.call_tool(
-        "calendar_list_events",
-        {
-            "project_key": "ALPHA",
-            "time_min": "2024-01-01T00:00:00Z",
-            "time_max": "2024-01-31T23:59:59Z",
-            "text_query": "sprint",
-            "max_results": 10,
-        },
-    )
+    """Test listing all calendars."""
+    result = await mcp_client.call_tool("calendar_list_calendars", {})
 
     assert result is not None
-    mock_calendar_service.list_events.assert_called_once()
+    mock_calendar_service.list_calendars.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_calendar_list_events_returns_events(
+@pytest.mark.parametrize(
+    ("arguments", "expected_kwargs"),
+    [
+        pytest.param(
+            {"project_key": "ALPHA"},
+            {"project_key": "ALPHA", "confluence_space_key": None},
+            id="existing",
+        ),
+        pytest.param(
+            {"project_key": "GAMMA", "confluence_space_key": "GAMMA"},
+            {"project_key": "GAMMA", "confluence_space_key": "GAMMA"},
+            id="with-confluence",
+        ),
+    ],
+)
+async def test_calendar_find_project_calendar(
     mcp_client: Client,
     mock_calendar_service: MockCalendarService,
+    arguments: dict[str, Any],
+    expected_kwargs: dict[str, Any],
 ) -> None:
-    """Test that calendar events are returned correctly."""
-    mock_calendar_service.list_events.return_value = [
-        {
-            "id": "test-event-1",
-            "summary": "Test Meeting",
-            "description": "A test meeting",
-            "start": "2024-01-15T10:00:00Z",
-            "end": "2024-01-15T11:00:00Z",
-            "location": "Room A",
-            "attendees": ["user@example.com"],
-        }
-    ]
+    """Test finding/creating calendar for project."""
+    result = await mcp_client.call_tool("calendar_find_project_calendar", arguments)
+
+    assert result is not None
+    mock_calendar_service.find_or_create_project_calendar.assert_called_once_with(
+        **expected_kwargs
+    )
 
+
+@pytest.mark.asyncio
+async def test_calendar_list_events_multi(
+    mcp_client: Client,
+    mock_calendar_service: MockCalendarService,
+) -> None:
+    """Test listing events for several calendars concurrently."""
     result = await mcp_client.call_tool(
-        "calendar_list_events", {"project_key": "ALPHA"}
+        "calendar_list_events_multi",
+        {"project_keys": ["ALPHA", "BETA"], "calendar_ids": ["direct-calendar"]},
     )
 
-    assert result is not None
+    content = result.structured_content
+    results = content["results"]
+    assert list(results) == ["calendar_alpha", "calendar_beta", "direct-calendar"]
+    assert content["project_calendars"] == {
+        "ALPHA": "calendar_alpha",
+        "BETA": "calendar_beta",
+    }
+    assert content["errors"] == content["project_errors"] == {}
+    assert mock_calendar_service.find_or_create_project_calendar.call_count == 2
+    assert mock_calendar_service.list_events.call_count == 3
+    assert all(len(page["events"]) == 2 for page in results.values())
 
 
 @pytest.mark.asyncio
-async def test_calendar_list_calendars(
+async def test_calendar_list_events_multi_fetches_shared_calendar_once(
     mcp_client: Client,
     mock_calendar_service: MockCalendarService,
 ) -> None:
-    """Test listing all calendars."""
-    result = await mcp_client.call_tool("calendar_list_calendars", {})
+    """Test a calendar named by both a project key and calendar_ids is fetched once."""
+    result = await mcp_client.call_tool(
+        "calendar_list_events_multi",
+        {"project_keys": ["ALPHA"], "calendar_ids": ["calendar_alpha", "ALPHA"]},
+    )
 
-    assert result is not None
-    mock_calendar_service.list_calendars.assert_called_once()
+    results = result.structured_content["results"]
+    assert list(results) == ["calendar_alpha", "ALPHA"]
+    assert result.structured_content["project_calendars"] == {"ALPHA": "calendar_alpha"}
+    called_ids = [
+        c.kwargs["calendar_id"]
+        for c in mock_calendar_service.list_events.call_args_list
+    ]
+    assert called_ids == ["calendar_alpha", "ALPHA"]
 
 
 @pytest.mark.asyncio
-async def test_calendar_find_project_calendar_existing(
+async def test_calendar_list_events_multi_partial_failure(
     mcp_client: Client,
     mock_calendar_service: MockCalendarService,
 ) -> None:
-    """Test finding existing calendar for project."""
+    """Test one failing calendar is reported while the others still return."""
+    list_events = mock_calendar_service.list_events.side_effect
+
+    async def fail_beta(calendar_id: str, **kwargs: Any) -> dict[str, Any]:
+        if calendar_id == "calendar_beta":
+            raise CalendarError("Calendar not found")
+        return await list_events(calendar_id=calendar_id, **kwargs)
+
+    mock_calendar_service.list_events.side_effect = fail_beta
+
     result = await mcp_client.call_tool(
-        "calendar_find_project_calendar", {"project_key": "ALPHA"}
+        "calendar_list_events_multi", {"project_keys": ["ALPHA", "BETA"]}
     )
 
-    assert result is not None
-    mock_calendar_service.find_or_create_project_calendar.assert_called_once_with(
-        project_key="ALPHA", confluence_space_key=None
+    content = result.structured_content
+    assert list(content["results"]) == ["calendar_alpha"]
+    assert len(content["results"]["calendar_alpha"]["events"]) == 2
+    assert content["errors"] == {"calendar_beta": "Calendar not found"}
+
+
+@pytest.mark.asyncio
+async def test_calendar_list_events_multi_all_failed(
+    mcp_client: Client,
+    mock_calendar_service: MockCalendarService,
+) -> None:
+    """Test the call fails only when no calendar could be listed."""
+    mock_calendar_service.find_or_create_project_calendar.side_effect = CalendarError(
+        "Calendar API unavailable"
+    )
+    mock_calendar_service.list_events.side_effect = CalendarError("Not found")
+
+    with pytest.raises(ToolError) as exc_info:
+        await mcp_client.call_tool(
+            "calendar_list_events_multi",
+            {"project_keys": ["ALPHA"], "calendar_ids": ["cal-1"]},
+        )
+
+    assert str(exc_info.value) == (
+        "Failed to list calendar events: "
+        "ALPHA: Calendar API unavailable; cal-1: Not found"
     )
 
 
 @pytest.mark.asyncio
-async def test_calendar_find_project_calendar_with_confluence(
+async def test_calendar_list_events_requires_identifier(
+    mcp_client: Client,
+    mock_calendar_service: MockCalendarService,
+) -> None:
+    """Test listing events without project_key or calendar_id fails fast."""
+    with pytest.raises(ToolError) as exc_info:
+        await mcp_client.call_tool("calendar_list_events", {})
+
+    assert str(exc_info.value) == "Must provide either project_key or calendar_id"
+    assert not mock_calendar_service.list_events.called
+
+
+@pytest.mark.asyncio
+async def test_calendar_list_events_fetch_all(
     mcp_client: Client,
     mock_calendar_service: MockCalendarService,
 ) -> None:
-    """Test finding/creating calendar with Confluence space."""
+    """Test fetch_all follows next_page_token until the last page."""
+    event = {"id": "e1", "summary": "Standup", "start": None, "end": None}
+    mock_calendar_service.list_events.side_effect = [
+        {"events": [event], "next_page_token": "page-2"},
+        {"events": [{**event, "id": "e2"}], "next_page_token": None},
+    ]
+
     result = await mcp_client.call_tool(
-        "calendar_find_project_calendar",
-        {"project_key": "GAMMA", "confluence_space_key": "GAMMA"},
+        "calendar_list_events", {"calendar_id": "cal-1", "fetch_all": True}
     )
 
-    assert result is not None
-    mock_calendar_service.find_or_create_project_calendar.assert_called_once_with(
-        project_key="GAMMA", confluence_space_key="GAMMA"
-    )
+    assert [e["id"] for e in result.structured_content["events"]] == ["e1", "e2"]
+    assert result.structured_content["next_page_token"] is None
+    calls = mock_calendar_service.list_events.call_args_list
+    assert [c.kwargs["page_token"] for c in calls] == [None, "page-2"]
+    assert {c.kwargs["max_results"] for c in calls} == {250}
@@ -0,0 +1,86 @@
+"""Tests for ConfluenceService."""
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import HTTPError
+
+from pm_mcp.core.errors import ConfluenceError
+from pm_mcp.services.confluence_service import ConfluenceService
+
+
+def _page(version: int, html: str) -> dict[str, Any]:
+    """Build a get_page_by_id response for the given version."""
+    return {
+        "id": "123",
+        "title": "Sprint Review",
+        "_links": {"webui": "/spaces/PROJ/pages/123"},
+        "body": {"storage": {"value": html}},
+        "version": {"number": version},
+    }
+
+
+async def test_get_page_content_cached_per_version() -> None:
+    """Test page bodies are parsed once per version and re-fetched after edits."""
+    service = ConfluenceService()
+    current = _page(1, "<p>Old notes</p>")
+    client = MagicMock()
+    client.get_page_by_id.side_effect = lambda page_id, expand: current
+
+    with (
+        patch.object(service, "_get_client", return_value=client),
+        patch.object(
+            service, "_parse_html_to_text", wraps=service._parse_html_to_text
+        ) as parse,
+    ):
+        first = await service.get_page_content("123")
+        second = await service.get_page_content("123")
+        assert parse.call_count == 1
+        assert second == first
+        assert first["body_text"] == "Old notes"
+
+        current = _page(2, "<p>New notes</p>")
+        third = await service.get_page_content("123")
+
+    assert parse.call_count == 2
+    assert third["body_text"] == "New notes"
+    # Body is only requested on cache misses
+    expands = [call.kwargs["expand"] for call in client.get_page_by_id.call_args_list]
+    assert expands.count("body.storage,space,version") == 2
+
+
+async def test_get_page_content_without_version_not_cached() -> None:
+    """Test pages without a version number are fetched fresh every time."""
+    service = ConfluenceService()
+    page = _page(1, "<p>Notes</p>")
+    del page["version"]
+    client = MagicMock()
+    client.get_page_by_id.return_value = page
+
+    with patch.object(service, "_get_client", return_value=client):
+        await service.get_page_content("123")
+        await service.get_page_content("123")
+
+    expands = [call.kwargs["expand"] for call in client.get_page_by_id.call_args_list]
+    assert expands.count("body.storage,space,version") == 2
+    assert len(service._page_content_cache) == 0
+
+
+async def test_get_page_version_error_reports_version_lookup() -> None:
+    """Test a failed version check is reported as such, not as a content fetch."""
+    service = ConfluenceService()
+    client = MagicMock()
+    client.get_page_by_id.side_effect = HTTPError("404 Not Found")
+
+    with (
+        patch.object(service, "_get_client", return_value=client),
+        pytest.raises(ConfluenceError) as exc_info,
+    ):
+        await service.get_page_content("123")
+
+    assert exc_info.value.details == {
+        "operation": "get_page_version",
+        "page_id": "123",
+    }
+    assert "page version" in exc_info.value.message
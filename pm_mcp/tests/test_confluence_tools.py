@@ -1,5 +1,7 @@
 """Tests for Confluence tools."""
 
+from typing import Any
+
 import pytest
 from fastmcp import Client
 
@@ -7,34 +9,27 @@ from pm_mcp.tests.mocks.mock_services import MockConfluenceService
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        pytest.param({"query": "sprint planning"}, id="query"),
+        pytest.param(
+            {
+                "query": "meeting notes",
+                "space_key": "TEAM",
+                "limit": 5,
+            },
+            id="with-space",
+        ),
+    ],
+)
 async def test_confluence_search_pages(
     mcp_client: Client,
     mock_confluence_service: MockConfluenceService,
+    arguments: dict[str, Any],
 ) -> None:
     """Test searching Confluence pages."""
-    result = await mcp_client.call_tool(
-        "confluence_search_pages",
-        {"query": "sprint planning"},
-    )
-
-    assert result is not None
-    mock_confluence_service.search_pages.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_confluence_search_pages_with_space(
-    mcp_client: Client,
-    mock_confluence_service: MockConfluenceService,
-) -> None:
-    """Test searching Confluence pages in specific space."""
-    result = await mcp_client.call_tool(
-        "confluence_search_pages",
-        {
-            "query": "meeting notes",
-            "space_key": "TEAM",
-            "limit": 5,
-        },
-    )
+    result = await mcp_client.call_tool("confluence_search_pages", arguments)
 
     assert result is not None
     mock_confluence_service.search_pages.assert_called_once()
@@ -56,39 +51,35 @@ async def test_confluence_get_page_content(
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        pytest.param(
+            {
+                "space_key": "TEAM",
+                "title": "Sprint 11 Planning",
+                "body_markdown": "# Sprint 11 Planning\n\n## Attendees\n- Alice\n- Bob",
+            },
+            id="top-level",
+        ),
+        pytest.param(
+            {
+                "space_key": "TEAM",
+                "title": "Sprint 11 Planning",
+                "body_markdown": "Content here",
+                "parent_page_id": "111111",
+            },
+            id="with-parent",
+        ),
+    ],
+)
 async def test_confluence_create_meeting_page(
     mcp_client: Client,
     mock_confluence_service: MockConfluenceService,
+    arguments: dict[str, Any],
 ) -> None:
     """Test creating a Confluence meeting page."""
-    result = await mcp_client.call_tool(
-        "confluence_create_meeting_page",
-        {
-            "space_key": "TEAM",
-            "title": "Sprint 11 Planning",
-            "body_markdown": "# Sprint 11 Planning\n\n## Attendees\n- Alice\n- Bob",
-        },
-    )
-
-    assert result is not None
-    mock_confluence_service.create_page.assert_called_once()
-
-
-@pytest.mark.asyncio
-async def test_confluence_create_meeting_page_with_parent(
-    mcp_client: Client,
-    mock_confluence_service: MockConfluenceService,
-) -> None:
-    """Test creating a Confluence page with parent."""
-    result = await mcp_client.call_tool(
-        "confluence_create_meeting_page",
-        {
-            "space_key": "TEAM",
-            "title": "Sprint 11 Planning",
-            "body_markdown": "Content here",
-            "parent_page_id": "111111",
-        },
-    )
+    result = await mcp_client.call_tool("confluence_create_meeting_page", arguments)
 
     assert result is not None
     mock_confluence_service.create_page.assert_called_once()
@@ -0,0 +1,62 @@
+"""Tests for client logging helpers."""
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pm_mcp.config import get_settings
+from pm_mcp.core.context import is_debug_enabled, log_debug
+from pm_mcp.server import create_http_app
+
+
+async def test_log_debug_skipped_when_debug_disabled(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test debug messages are neither formatted nor sent above DEBUG."""
+    caplog.set_level(logging.INFO, logger="pm_mcp.tools")
+    ctx = AsyncMock()
+
+    await log_debug(ctx, "Params: %s", "value")
+
+    assert not is_debug_enabled()
+    ctx.debug.assert_not_awaited()
+
+
+async def test_log_debug_sent_when_debug_enabled(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test debug messages are formatted and sent at DEBUG."""
+    caplog.set_level(logging.DEBUG, logger="pm_mcp.tools")
+    ctx = AsyncMock()
+
+    await log_debug(ctx, "Params: limit=%s, space=%s", 10, None)
+
+    assert is_debug_enabled()
+    ctx.debug.assert_awaited_once_with("Params: limit=10, space=None")
+
+
+async def test_log_debug_follows_log_level_setting(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the app lifespan applies LOG_LEVEL=DEBUG to client debug messages."""
+    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+    get_settings.cache_clear()
+    package_logger = logging.getLogger("pm_mcp")
+    previous_level = package_logger.level
+    ctx = AsyncMock()
+
+    async def run_app() -> None:
+        app = create_http_app()
+        async with app.router.lifespan_context(app):
+            await log_debug(ctx, "Params: %s", "value")
+
+    try:
+        # Own event loop: the lifespan replaces the loop's default executor
+        await asyncio.to_thread(asyncio.run, run_app())
+    finally:
+        package_logger.setLevel(previous_level)
+        get_settings.cache_clear()
+
+    ctx.debug.assert_awaited_once_with("Params: value")
@@ -0,0 +1,121 @@
+"""Tests for JiraService."""
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import HTTPError
+
+from pm_mcp.core.errors import JiraError
+from pm_mcp.services.jira_service import DEFAULT_ISSUE_FIELDS, JiraService
+
+
+def _raw_issue(key: str) -> dict[str, Any]:
+    """Build a raw issue as returned by Jira search."""
+    return {
+        "key": key,
+        "id": key.rsplit("-", 1)[1],
+        "fields": {
+            "summary": f"Issue {key}",
+            "status": {"name": "To Do", "statusCategory": {"name": "To Do"}},
+        },
+    }
+
+
+def _page(keys: list[str], next_page_token: str | None = None) -> dict[str, Any]:
+    """Build one enhanced_jql result page."""
+    page: dict[str, Any] = {"issues": [_raw_issue(key) for key in keys]}
+    if next_page_token:
+        page["nextPageToken"] = next_page_token
+    return page
+
+
+@pytest.fixture
+def jira_client() -> MagicMock:
+    """Jira client whose enhanced_jql pages are set per test."""
+    return MagicMock()
+
+
+@pytest.fixture
+def jira_service(jira_client: MagicMock) -> JiraService:
+    """JiraService talking to the mocked client."""
+    service = JiraService()
+    service._client = jira_client
+    return service
+
+
+def test_search_follows_pages_and_trims_to_max_results(
+    jira_service: JiraService, jira_client: MagicMock
+) -> None:
+    """Test paging stops at max_results and drops any surplus issues."""
+    jira_client.enhanced_jql.side_effect = [
+        _page(["P-1", "P-2", "P-3"], next_page_token="t1"),
+        _page(["P-4", "P-5", "P-6"], next_page_token="t2"),
+    ]
+
+    issues = jira_service._search_sync("project = P", DEFAULT_ISSUE_FIELDS, 5)
+
+    assert [issue["key"] for issue in issues] == ["P-1", "P-2", "P-3", "P-4", "P-5"]
+    calls = jira_client.enhanced_jql.call_args_list
+    assert [c.kwargs["nextPageToken"] for c in calls] == [None, "t1"]
+    assert [c.kwargs["limit"] for c in calls] == [5, 2]
+
+
+@pytest.mark.parametrize(
+    "last_page",
+    [
+        pytest.param(_page(["P-3"]), id="missing-token"),
+        pytest.param(_page([], next_page_token="t2"), id="empty-page"),
+    ],
+)
+def test_search_stops_on_last_page(
+    jira_service: JiraService, jira_client: MagicMock, last_page: dict[str, Any]
+) -> None:
+    """Test paging stops without a next token or on an empty page."""
+    jira_client.enhanced_jql.side_effect = [
+        _page(["P-1", "P-2"], next_page_token="t1"),
+        last_page,
+        AssertionError("requested a page past the end"),
+    ]
+
+    issues = jira_service._search_sync("project = P", DEFAULT_ISSUE_FIELDS, 50)
+
+    assert jira_client.enhanced_jql.call_count == 2
+    assert len(issues) == 2 + len(last_page["issues"])
+
+
+async def test_get_issues_by_keys_quotes_and_escapes_keys(
+    jira_service: JiraService, jira_client: MagicMock
+) -> None:
+    """Test keys are quoted and escaped into a single key-in search."""
+    jira_client.enhanced_jql.return_value = _page(["PROJ-1"])
+
+    issues = await jira_service.get_issues_by_keys(["PROJ-1", 'PROJ-2" OR x="y'])
+
+    jira_client.enhanced_jql.assert_called_once()
+    call = jira_client.enhanced_jql.call_args
+    assert call.args[0] == r'key in ("PROJ-1", "PROJ-2\" OR x=\"y")'
+    assert call.kwargs["limit"] == 2
+    assert [issue["key"] for issue in issues] == ["PROJ-1"]
+    assert issues[0]["status_category"] == "To Do"
+
+
+async def test_get_issues_by_keys_http_error_raises_jira_error(
+    jira_service: JiraService, jira_client: MagicMock
+) -> None:
+    """Test a rejected search surfaces as JiraError."""
+    jira_client.enhanced_jql.side_effect = HTTPError("400 Bad Request")
+
+    with pytest.raises(JiraError):
+        await jira_service.get_issues_by_keys(["PROJ-404"])
+
+
+async def test_get_issues_by_keys_empty_skips_search(
+    jira_service: JiraService, jira_client: MagicMock
+) -> None:
+    """Test no search is made for an empty key list."""
+    with patch.object(jira_service, "_search_sync") as search:
+        assert await jira_service.get_issues_by_keys([]) == []
+
+    search.assert_not_called()
+    jira_client.enhanced_jql.assert_not_called()
@@ -62,6 +62,13 @@ async def test_jira_create_issues_batch(
 
     assert result is not None
     mock_jira_service.create_issues_batch.assert_called_once()
+    # None fields are dropped; set defaults (issue_type) are kept
+    issues_data = mock_jira_service.create_issues_batch.call_args.kwargs["issues"]
+    assert issues_data[1] == {
+        "summary": "Task 2",
+        "issue_type": "Task",
+        "assignee": "alice",
+    }
 
 
 @pytest.mark.asyncio
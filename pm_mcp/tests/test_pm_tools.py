@@ -1,13 +1,66 @@
 """Tests for PM layer tools."""
 
+import asyncio
+from types import MappingProxyType
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
 import pytest
 from fastmcp import Client
 
+from pm_mcp.core.errors import JiraError
+from pm_mcp.services.pm_service import PmService
 from pm_mcp.tests.mocks.mock_services import (
     MockCalendarService,
     MockJiraService,
 )
 
+# Issues with different statuses for get_project_snapshot (read-only)
+_SNAPSHOT_ISSUES = (
+    MappingProxyType(
+        {
+            "key": "PROJ-1",
+            "id": "10001",
+            "url": "https://jira.example.com/browse/PROJ-1",
+            "summary": "Task 1",
+            "status": "To Do",
+            "status_category": "To Do",
+            "assignee": "Alice",
+            "labels": [],
+            "due_date": "2024-01-10",  # Overdue
+            "updated": "2024-01-15T10:00:00Z",
+        }
+    ),
+    MappingProxyType(
+        {
+            "key": "PROJ-2",
+            "id": "10002",
+            "url": "https://jira.example.com/browse/PROJ-2",
+            "summary": "Task 2",
+            "status": "In Progress",
+            "status_category": "In Progress",
+            "assignee": "Bob",
+            "labels": [],
+            "due_date": None,
+            "updated": "2024-01-15T10:00:00Z",
+        }
+    ),
+    MappingProxyType(
+        {
+            "key": "PROJ-3",
+            "id": "10003",
+            "url": "https://jira.example.com/browse/PROJ-3",
+            "summary": "Task 3",
+            "status": "Done",
+            "status_category": "Done",
+            "assignee": "Alice",
+            "labels": [],
+            "due_date": None,
+            "updated": "2024-01-15T10:00:00Z",
+        }
+    ),
+)
+
 
 @pytest.mark.asyncio
 async def test_pm_link_meeting_issues(
@@ -74,6 +127,63 @@ async def test_pm_link_meeting_issues_minimal(
     assert metadata["issue_keys"] == ["PROJ-3"]
 
 
+@pytest.mark.asyncio
+async def test_pm_link_meetings_batch(
+    mock_pm_service: PmService,
+    mock_calendar_service: MockCalendarService,
+    mock_jira_service: MockJiraService,
+) -> None:
+    """Test linking several meetings in one call."""
+    results = await mock_pm_service.link_meetings_batch(
+        calendar_service=mock_calendar_service,
+        jira_service=mock_jira_service,
+        calendar_id="calendar_alpha",
+        items=[
+            {"meeting_id": "event1", "issue_keys": ["PROJ-1"]},
+            {"meeting_id": "event2", "issue_keys": ["PROJ-1", "PROJ-2"]},
+            {"meeting_id": "event3"},  # Malformed: no issue_keys
+        ],
+    )
+
+    assert [r["meeting_id"] for r in results] == ["event1", "event2", "event3"]
+    assert "error" in results[2]
+    metadata = await mock_calendar_service.get_event_metadata(
+        "calendar_alpha", "event2"
+    )
+    assert metadata["issue_keys"] == ["PROJ-1", "PROJ-2"]
+
+
+@pytest.mark.asyncio
+async def test_pm_link_meetings_batch_tool(
+    mcp_client: Client,
+    mock_calendar_service: MockCalendarService,
+) -> None:
+    """Test the batch tool links every meeting in the project calendar."""
+    result = await mcp_client.call_tool(
+        "pm_link_meetings_batch",
+        {
+            "project_key": "ALPHA",
+            "items": [
+                {"calendar_event_id": "event1", "jira_issue_keys": ["PROJ-1"]},
+                {
+                    "calendar_event_id": "event2",
+                    "jira_issue_keys": ["PROJ-2"],
+                    "confluence_page_id": "page456",
+                },
+            ],
+        },
+    )
+
+    results = result.structured_content["results"]
+    assert [r["calendar_event_id"] for r in results] == ["event1", "event2"]
+    assert all(r["error"] is None for r in results)
+    metadata = await mock_calendar_service.get_event_metadata(
+        "calendar_alpha", "event2"
+    )
+    assert metadata["issue_keys"] == ["PROJ-2"]
+    assert metadata["confluence_page_id"] == "page456"
+
+
 @pytest.mark.asyncio
 async def test_pm_get_meeting_issues(
     mcp_client: Client,
@@ -90,7 +200,7 @@ async def test_pm_get_meeting_issues(
     await mock_calendar_service.update_event_metadata(
         calendar_id="calendar_alpha",
         event_id="event123",
-        jira_issues=["PROJ-1", "PROJ-2"],
+        jira_issues=["PROJ-1", "PROJ-404", "PROJ-2"],
         confluence_page_id="page456",
         project_key="PROJ",
     )
@@ -101,6 +211,109 @@ async def test_pm_get_meeting_issues(
     )
 
     assert result is not None
+    # One batch search; only the key it missed is fetched directly (and skipped)
+    issue_keys = [issue["key"] for issue in result.structured_content["issues"]]
+    assert issue_keys == ["PROJ-1", "PROJ-2"]
+    assert mock_jira_service.get_issues_by_keys.call_count == 1
+    assert mock_jira_service.get_issue.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_pm_get_meeting_issues_batch_error_falls_back(
+    mcp_client: Client,
+    mock_calendar_service: MockCalendarService,
+    mock_jira_service: MockJiraService,
+) -> None:
+    """Test a failed batch search falls back to per-key issue fetches."""
+    await mock_calendar_service.update_event_metadata(
+        calendar_id="calendar_alpha",
+        event_id="event123",
+        jira_issues=["PROJ-2", "PROJ-1"],
+    )
+
+    with patch.object(
+        mock_jira_service,
+        "get_issues_by_keys",
+        AsyncMock(side_effect=JiraError("Key PROJ-9 does not exist")),
+    ):
+        result = await mcp_client.call_tool(
+            "pm_get_meeting_issues",
+            {"project_key": "ALPHA", "calendar_event_id": "event123"},
+        )
+
+    issue_keys = [issue["key"] for issue in result.structured_content["issues"]]
+    assert issue_keys == ["PROJ-2", "PROJ-1"]
+    assert mock_jira_service.get_issue.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_pm_get_meeting_issues_cached_until_relinked(
+    mcp_client: Client,
+    mock_calendar_service: MockCalendarService,
+) -> None:
+    """Test repeated lookups hit the cache and linking invalidates it."""
+    args = {"project_key": "ALPHA", "calendar_event_id": "event1"}
+
+    await mcp_client.call_tool("pm_get_meeting_issues", args)
+    await mcp_client.call_tool("pm_get_meeting_issues", args)
+    assert mock_calendar_service.get_event_metadata.call_count == 1
+
+    await mcp_client.call_tool(
+        "pm_link_meeting_issues",
+        {**args, "jira_issue_keys": ["PROJ-1"]},
+    )
+    await mcp_client.call_tool("pm_get_meeting_issues", args)
+    assert mock_calendar_service.get_event_metadata.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_meeting_issues_not_cached_when_relinked_during_fetch(
+    mock_pm_service: PmService,
+    mock_calendar_service: MockCalendarService,
+    mock_jira_service: MockJiraService,
+) -> None:
+    """Test a lookup overlapping a link does not cache the old metadata."""
+    fetched = asyncio.Event()
+    release = asyncio.Event()
+    get_event_metadata = mock_calendar_service.get_event_metadata
+
+    async def slow_get_event_metadata(
+        calendar_id: str, event_id: str
+    ) -> dict[str, Any]:
+        metadata = await get_event_metadata(calendar_id, event_id)
+        fetched.set()
+        await release.wait()
+        return metadata
+
+    with patch.object(
+        mock_calendar_service,
+        "get_event_metadata",
+        AsyncMock(side_effect=slow_get_event_metadata),
+    ):
+        lookup = asyncio.create_task(
+            mock_pm_service.get_meeting_issues(
+                calendar_service=mock_calendar_service,
+                calendar_id="calendar_alpha",
+                meeting_id="event1",
+            )
+        )
+        await fetched.wait()
+        await mock_pm_service.link_meeting_issues(
+            calendar_service=mock_calendar_service,
+            jira_service=mock_jira_service,
+            calendar_id="calendar_alpha",
+            meeting_id="event1",
+            issue_keys=["PROJ-1"],
+        )
+        release.set()
+        assert (await lookup)["issue_keys"] == []
+
+    result = await mock_pm_service.get_meeting_issues(
+        calendar_service=mock_calendar_service,
+        calendar_id="calendar_alpha",
+        meeting_id="event1",
+    )
+    assert result["issue_keys"] == ["PROJ-1"]
 
 
 @pytest.mark.asyncio
@@ -122,45 +335,7 @@ async def test_pm_get_project_snapshot(
     mock_jira_service: MockJiraService,
 ) -> None:
     """Test getting project snapshot."""
-    # Setup mock issues with different statuses
-    mock_jira_service.list_issues.return_value = [
-        {
-            "key": "PROJ-1",
-            "id": "10001",
-            "url": "https://jira.example.com/browse/PROJ-1",
-            "summary": "Task 1",
-            "status": "To Do",
-            "status_category": "To Do",
-            "assignee": "Alice",
-            "labels": [],
-            "due_date": "2024-01-10",  # Overdue
-            "updated": "2024-01-15T10:00:00Z",
-        },
-        {
-            "key": "PROJ-2",
-            "id": "10002",
-            "url": "https://jira.example.com/browse/PROJ-2",
-            "summary": "Task 2",
-            "status": "In Progress",
-            "status_category": "In Progress",
-            "assignee": "Bob",
-            "labels": [],
-            "due_date": None,
-            "updated": "2024-01-15T10:00:00Z",
-        },
-        {
-            "key": "PROJ-3",
-            "id": "10003",
-            "url": "https://jira.example.com/browse/PROJ-3",
-            "summary": "Task 3",
-            "status": "Done",
-            "status_category": "Done",
-            "assignee": "Alice",
-            "labels": [],
-            "due_date": None,
-            "updated": "2024-01-15T10:00:00Z",
-        },
-    ]
+    mock_jira_service.list_issues.return_value = list(_SNAPSHOT_ISSUES)
 
     result = await mcp_client.call_tool(
         "pm_get_project_snapshot",
@@ -168,3 +343,9 @@ async def test_pm_get_project_snapshot(
     )
 
     assert result is not None
+    assert result.structured_content["by_assignee"] == {"Alice": 2, "Bob": 1}
+    # Snapshot only needs the fields used by the aggregation
+    assert (
+        mock_jira_service.list_issues.call_args.kwargs["fields"]
+        == "status,assignee,duedate"
+    )
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from pm_mcp.core.models import BaseMcpModel
 
@@ -23,16 +23,23 @@ class CalendarListEventsRequest(BaseMcpModel):
         description="Optional text search in event summary/description",
     )
     max_results: int = Field(
-        default=50,
+        default=20,
         ge=1,
         le=250,
         description="Maximum number of events to return",
     )
+    page_token: str | None = Field(
+        default=None,
+        description="next_page_token from a previous call to fetch the next page",
+    )
 
 
 class CalendarEvent(BaseMcpModel):
     """Calendar event model."""
 
+    # Built once per API item and never mutated
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="Event ID")
     summary: str = Field(description="Event title/summary")
     description: str | None = Field(default=None, description="Event description")
@@ -48,11 +55,38 @@ class CalendarListEventsResponse(BaseMcpModel):
     """Response model for calendar_list_events tool."""
 
     events: list[CalendarEvent] = Field(description="List of calendar events")
+    next_page_token: str | None = Field(
+        default=None,
+        description="Token for the next page of events (None on the last page)",
+    )
+
+
+class CalendarMultiEventsResponse(BaseMcpModel):
+    """Response model for calendar_list_events_multi tool."""
+
+    results: dict[str, CalendarListEventsResponse] = Field(
+        description="Events per calendar ID"
+    )
+    project_calendars: dict[str, str] = Field(
+        default_factory=dict,
+        description="Calendar ID each requested project key resolved to",
+    )
+    errors: dict[str, str] = Field(
+        default_factory=dict,
+        description="Error per calendar ID whose events could not be listed",
+    )
+    project_errors: dict[str, str] = Field(
+        default_factory=dict,
+        description="Error per project key whose calendar could not be resolved",
+    )
 
 
 class CalendarInfo(BaseMcpModel):
     """Calendar information with metadata."""
 
+    # Built once per API item and never mutated
+    model_config = ConfigDict(frozen=True)
+
     calendar_id: str = Field(description="Calendar ID")
     name: str = Field(description="Calendar display name")
     description: str | None = Field(
@@ -1,22 +1,44 @@
 """Calendar MCP tools implementation."""
 
+import asyncio
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
 from fastmcp.server.context import Context
 from pydantic import Field
 
+from pm_mcp.core.context import log_debug
 from pm_mcp.core.errors import CalendarError
 from pm_mcp.tools.calendar.models import (
     CalendarEvent,
     CalendarListEventsResponse,
+    CalendarMultiEventsResponse,
     CalendarInfo,
     CalendarListResponse,
     CalendarFindResponse,
 )
 
+# Events per call: small default page, fetch_all pages at the API maximum
+DEFAULT_MAX_RESULTS = 20
+FETCH_ALL_PAGE_SIZE = 250
+FETCH_ALL_MAX_EVENTS = 2500
+
+# Argument types shared by the event listing tools
+TimeMin = Annotated[
+    datetime | None,
+    Field(description="Start of time range (ISO 8601). Default: now - 7 days"),
+]
+TimeMax = Annotated[
+    datetime | None,
+    Field(description="End of time range (ISO 8601). Default: now + 7 days"),
+]
+TextQuery = Annotated[
+    str | None,
+    Field(description="Optional text search in event summary/description"),
+]
+
 
 def register_calendar_tools(mcp: FastMCP) -> None:
     """Register calendar tools with the MCP server.
@@ -40,62 +62,200 @@ def register_calendar_tools(mcp: FastMCP) -> None:
             str | None,
             Field(description="Direct calendar ID (alternative to project_key)"),
         ] = None,
-        time_min: Annotated[
-            datetime | None,
-            Field(description="Start of time range (ISO 8601). Default: now - 7 days"),
-        ] = None,
-        time_max: Annotated[
-            datetime | None,
-            Field(description="End of time range (ISO 8601). Default: now + 7 days"),
-        ] = None,
-        text_query: Annotated[
-            str | None,
-            Field(description="Optional text search in event summary/description"),
-        ] = None,
+        time_min: TimeMin = None,
+        time_max: TimeMax = None,
+        text_query: TextQuery = None,
         max_results: Annotated[
             int,
             Field(
                 ge=1, le=250, description="Maximum number of events to return (1-250)"
             ),
-        ] = 50,
+        ] = DEFAULT_MAX_RESULTS,
+        page_token: Annotated[
+            str | None,
+            Field(description="next_page_token from a previous call (next page)"),
+        ] = None,
+        fetch_all: Annotated[
+            bool,
+            Field(
+                description="Fetch every page (ignores max_results, up to "
+                f"{FETCH_ALL_MAX_EVENTS} events; next_page_token is set if more remain)"
+            ),
+        ] = False,
     ) -> CalendarListEventsResponse:
         """List calendar events in time range."""
+        # Validate before any client round-trip: at least one identifier
+        if not project_key and not calendar_id:
+            raise ToolError("Must provide either project_key or calendar_id")
+
         await ctx.info("Fetching calendar events")
         try:
             calendar_service = ctx.fastmcp.calendar_service  # type: ignore[attr-defined]
 
-            # Validate: at least one identifier provided
-            if not project_key and not calendar_id:
-                raise ToolError("Must provide either project_key or calendar_id")
-
             # Resolve calendar_id from project_key if needed
             resolved_calendar_id = calendar_id
             if project_key:
-                await ctx.debug(f"Resolving calendar for project: {project_key}")
+                await log_debug(ctx, "Resolving calendar for project: %s", project_key)
                 calendar = await calendar_service.find_or_create_project_calendar(
                     project_key=project_key
                 )
                 resolved_calendar_id = calendar["calendar_id"]
-                await ctx.debug(f"Resolved calendar_id: {resolved_calendar_id}")
 
-            await ctx.debug(
-                f"Params: calendar_id={resolved_calendar_id}, time_min={time_min}, "
-                f"time_max={time_max}, text_query={text_query}, max_results={max_results}"
+            await log_debug(
+                ctx,
+                "Params: calendar_id=%s, time_min=%s, time_max=%s, text_query=%s, "
+                "max_results=%s, page_token=%s, fetch_all=%s",
+                resolved_calendar_id,
+                time_min,
+                time_max,
+                text_query,
+                max_results,
+                page_token,
+                fetch_all,
             )
 
-            events = await calendar_service.list_events(
-                calendar_id=resolved_calendar_id,
-                time_min=time_min,
-                time_max=time_max,
-                text_query=text_query,
-                max_results=max_results,
-            )
+            events: list[dict[str, Any]] = []
+            while True:
+                page = await calendar_service.list_events(
+                    calendar_id=resolved_calendar_id,
+                    time_min=time_min,
+                    time_max=time_max,
+                    text_query=text_query,
+                    max_results=FETCH_ALL_PAGE_SIZE if fetch_all else max_results,
+                    page_token=page_token,
+                )
+                events.extend(page["events"])
+                page_token = page["next_page_token"]
+                if (
+                    not fetch_all
+                    or not page_token
+                    or len(events) >= FETCH_ALL_MAX_EVENTS
+                ):
+                    break
 
             await ctx.info(f"Found {len(events)} calendar events")
-            return CalendarListEventsResponse(
-                events=[CalendarEvent(**event) for event in events]
+            construct_event = CalendarEvent.model_construct
+            return CalendarListEventsResponse.model_construct(
+                events=[construct_event(**event) for event in events],
+                next_page_token=page_token,
+            )
+
+        except CalendarError as e:
+            raise ToolError(e.message) from e
+        except Exception as e:
+            raise ToolError(f"Failed to list calendar events: {e}") from e
+
+    @mcp.tool(
+        name="calendar_list_events_multi",
+        description="List calendar events for several projects/calendars at once. "
+        "Use this instead of repeated calendar_list_events calls when a question spans "
+        "multiple projects. Provide project_keys and/or calendar_ids. "
+        "Results are keyed by calendar ID; calendars that fail are listed in errors.",
+    )
+    async def calendar_list_events_multi(
+        ctx: Context,
+        project_keys: Annotated[
+            list[str] | None,
+            Field(description="Jira project keys to find calendars (e.g., ['ALPHA'])"),
+        ] = None,
+        calendar_ids: Annotated[
+            list[str] | None,
+            Field(description="Direct calendar IDs (in addition to project_keys)"),
+        ] = None,
+        time_min: TimeMin = None,
+        time_max: TimeMax = None,
+        text_query: TextQuery = None,
+        max_results: Annotated[
+            int,
+            Field(
+                ge=1,
+                le=250,
+                description="Maximum number of events per calendar (1-250)",
+            ),
+        ] = DEFAULT_MAX_RESULTS,
+    ) -> CalendarMultiEventsResponse:
+        """List first page of events for several calendars concurrently."""
+        if not project_keys and not calendar_ids:
+            raise ToolError("Must provide project_keys and/or calendar_ids")
+
+        await ctx.info("Fetching calendar events for multiple calendars")
+        try:
+            # CalendarService bounds concurrent API calls, so fan out freely
+            calendar_service = ctx.fastmcp.calendar_service  # type: ignore[attr-defined]
+
+            async def resolve(project_key: str) -> str:
+                calendar = await calendar_service.find_or_create_project_calendar(
+                    project_key=project_key
+                )
+                return calendar["calendar_id"]
+
+            async def list_page(calendar_id: str) -> dict[str, Any]:
+                return await calendar_service.list_events(
+                    calendar_id=calendar_id,
+                    time_min=time_min,
+                    time_max=time_max,
+                    text_query=text_query,
+                    max_results=max_results,
+                )
+
+            # One failed project or calendar must not abort the rest
+            project_keys = list(dict.fromkeys(project_keys or ()))
+            resolved_ids = await asyncio.gather(
+                *map(resolve, project_keys), return_exceptions=True
+            )
+            project_calendars: dict[str, str] = {}
+            project_errors: dict[str, str] = {}
+            for project_key, resolved in zip(project_keys, resolved_ids):
+                if isinstance(resolved, Exception):
+                    project_errors[project_key] = str(resolved)
+                else:
+                    project_calendars[project_key] = resolved
+
+            # Each calendar is fetched once, even if both a project key and
+            # calendar_ids point at it
+            target_ids = list(
+                dict.fromkeys([*project_calendars.values(), *(calendar_ids or ())])
+            )
+            pages = await asyncio.gather(
+                *map(list_page, target_ids), return_exceptions=True
+            )
+
+            construct_event = CalendarEvent.model_construct
+            results: dict[str, CalendarListEventsResponse] = {}
+            errors: dict[str, str] = {}
+            for calendar_id, page in zip(target_ids, pages):
+                if isinstance(page, Exception):
+                    errors[calendar_id] = str(page)
+                else:
+                    results[calendar_id] = CalendarListEventsResponse.model_construct(
+                        events=[construct_event(**event) for event in page["events"]],
+                        next_page_token=page["next_page_token"],
+                    )
+
+            if not results:
+                failures = [*project_errors.items(), *errors.items()]
+                raise ToolError(
+                    "Failed to list calendar events: "
+                    + "; ".join(f"{key}: {message}" for key, message in failures)
+                )
+            if project_errors or errors:
+                await ctx.warning(
+                    f"Could not list events for: {[*project_errors, *errors]}"
+                )
+
+            await ctx.info(
+                f"Found {sum(len(page.events) for page in results.values())} events "
+                f"in {len(results)} calendars"
+            )
+            return CalendarMultiEventsResponse.model_construct(
+                results=results,
+                project_calendars=project_calendars,
+                errors=errors,
+                project_errors=project_errors,
             )
 
+        except ToolError:
+            raise
         except CalendarError as e:
             raise ToolError(e.message) from e
         except Exception as e:
@@ -114,8 +274,9 @@ def register_calendar_tools(mcp: FastMCP) -> None:
             calendars = await calendar_service.list_calendars()
 
             await ctx.info(f"Found {len(calendars)} calendars")
-            return CalendarListResponse(
-                calendars=[CalendarInfo(**cal) for cal in calendars]
+            construct_info = CalendarInfo.model_construct
+            return CalendarListResponse.model_construct(
+                calendars=[construct_info(**cal) for cal in calendars]
             )
 
         except CalendarError as e:
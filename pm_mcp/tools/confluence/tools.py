@@ -7,6 +7,7 @@ from fastmcp.exceptions import ToolError
 from fastmcp.server.context import Context
 from pydantic import Field
 
+from pm_mcp.core.context import log_debug
 from pm_mcp.core.errors import ConfluenceError
 from pm_mcp.tools.confluence.models import (
     ConfluenceCreateMeetingPageResponse,
@@ -45,7 +46,7 @@ def register_confluence_tools(mcp: FastMCP) -> None:
         await ctx.info(f"Searching Confluence pages: '{query}'")
         try:
             confluence_service = ctx.fastmcp.confluence_service  # type: ignore[attr-defined]
-            await ctx.debug(f"Params: space_key={space_key}, limit={limit}")
+            await log_debug(ctx, "Params: space_key=%s, limit=%s", space_key, limit)
             pages = await confluence_service.search_pages(
                 query=query,
                 space_key=space_key,
@@ -53,8 +54,9 @@ def register_confluence_tools(mcp: FastMCP) -> None:
             )
 
             await ctx.info(f"Found {len(pages)} Confluence pages")
-            return ConfluenceSearchPagesResponse(
-                pages=[ConfluencePageSummary(**page) for page in pages]
+            construct_page = ConfluencePageSummary.model_construct
+            return ConfluenceSearchPagesResponse.model_construct(
+                pages=[construct_page(**page) for page in pages]
             )
 
         except ConfluenceError as e:
@@ -76,7 +78,7 @@ def register_confluence_tools(mcp: FastMCP) -> None:
         try:
             confluence_service = ctx.fastmcp.confluence_service  # type: ignore[attr-defined]
             page = await confluence_service.get_page_content(page_id=page_id)
-            await ctx.debug(f"Retrieved page: {page.get('title', 'N/A')}")
+            await log_debug(ctx, "Retrieved page: %s", page.get("title", "N/A"))
             return ConfluencePageContent(**page)
 
         except ConfluenceError as e:
@@ -105,9 +107,11 @@ def register_confluence_tools(mcp: FastMCP) -> None:
         await ctx.info(f"Creating Confluence page: '{title}' in space {space_key}")
         try:
             confluence_service = ctx.fastmcp.confluence_service  # type: ignore[attr-defined]
-            await ctx.debug(
-                f"Params: parent_page_id={parent_page_id}, "
-                f"body_length={len(body_markdown)} chars"
+            await log_debug(
+                ctx,
+                "Params: parent_page_id=%s, body_length=%s chars",
+                parent_page_id,
+                len(body_markdown),
             )
             page = await confluence_service.create_page(
                 space_key=space_key,
@@ -1,6 +1,6 @@
 """Pydantic models for Jira tools."""
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 
 from pm_mcp.core.models import BaseMcpModel
 
@@ -156,3 +156,9 @@ class JiraAddCommentResponse(BaseMcpModel):
 
     issue_key: str = Field(description="Issue key")
     comment_id: str = Field(description="Created comment ID")
+
+
+# Built once: validate a whole service result list in a single call
+ISSUE_SUMMARY_LIST_ADAPTER = TypeAdapter(list[JiraIssueSummary])
+CREATED_ISSUE_LIST_ADAPTER = TypeAdapter(list[JiraCreatedIssue])
+ISSUE_TO_CREATE_LIST_ADAPTER = TypeAdapter(list[JiraIssueToCreate])
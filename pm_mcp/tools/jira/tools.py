@@ -7,13 +7,15 @@ from fastmcp.exceptions import ToolError
 from fastmcp.server.context import Context
 from pydantic import Field
 
+from pm_mcp.core.context import is_debug_enabled, log_debug
 from pm_mcp.core.errors import JiraError
 from pm_mcp.core.metrics import TOOL_CALLS, TOOL_DURATION
 from pm_mcp.tools.jira.models import (
+    CREATED_ISSUE_LIST_ADAPTER,
+    ISSUE_SUMMARY_LIST_ADAPTER,
+    ISSUE_TO_CREATE_LIST_ADAPTER,
     JiraAddCommentResponse,
     JiraCreateIssuesBatchResponse,
-    JiraCreatedIssue,
-    JiraIssueSummary,
     JiraIssueToCreate,
     JiraListIssuesResponse,
     JiraUpdateIssueResponse,
@@ -25,6 +27,19 @@ def register_jira_tools(mcp: FastMCP) -> None:
 
     Tools access JiraService via ctx.fastmcp.jira_service.
     """
+    # Bind metric children once instead of resolving labels on every call
+    list_issues_duration = TOOL_DURATION.labels(tool_name="jira_list_issues")
+    list_issues_success = TOOL_CALLS.labels(
+        tool_name="jira_list_issues", status="success"
+    )
+    list_issues_error = TOOL_CALLS.labels(tool_name="jira_list_issues", status="error")
+    create_batch_duration = TOOL_DURATION.labels(tool_name="jira_create_issues_batch")
+    create_batch_success = TOOL_CALLS.labels(
+        tool_name="jira_create_issues_batch", status="success"
+    )
+    create_batch_error = TOOL_CALLS.labels(
+        tool_name="jira_create_issues_batch", status="error"
+    )
 
     @mcp.tool(
         name="jira_list_issues",
@@ -67,13 +82,17 @@ def register_jira_tools(mcp: FastMCP) -> None:
         ] = 50,
     ) -> JiraListIssuesResponse:
         """List Jira issues with filters."""
-        with TOOL_DURATION.labels(tool_name="jira_list_issues").time():
+        with list_issues_duration.time():
             await ctx.info(f"Listing Jira issues for project: {project_key}")
             try:
                 jira_service = ctx.fastmcp.jira_service  # type: ignore[attr-defined]
-                await ctx.debug(
-                    f"Filters: status_category={status_category}, assignee={assignee}, "
-                    f"labels={labels}, text_query={text_query}"
+                await log_debug(
+                    ctx,
+                    "Filters: status_category=%s, assignee=%s, labels=%s, text_query=%s",
+                    status_category,
+                    assignee,
+                    labels,
+                    text_query,
                 )
                 issues = await jira_service.list_issues(
                     project_key=project_key,
@@ -87,16 +106,17 @@ def register_jira_tools(mcp: FastMCP) -> None:
                 )
 
                 await ctx.info(f"Found {len(issues)} Jira issues")
-                TOOL_CALLS.labels(tool_name="jira_list_issues", status="success").inc()
-                return JiraListIssuesResponse(
-                    issues=[JiraIssueSummary(**issue) for issue in issues]
+                list_issues_success.inc()
+                # Items are validated by the adapter; skip the outer pass
+                return JiraListIssuesResponse.model_construct(
+                    issues=ISSUE_SUMMARY_LIST_ADAPTER.validate_python(issues)
                 )
 
             except JiraError as e:
-                TOOL_CALLS.labels(tool_name="jira_list_issues", status="error").inc()
+                list_issues_error.inc()
                 raise ToolError(e.message) from e
             except Exception as e:
-                TOOL_CALLS.labels(tool_name="jira_list_issues", status="error").inc()
+                list_issues_error.inc()
                 raise ToolError(f"Failed to list Jira issues: {e}") from e
 
     @mcp.tool(
@@ -113,38 +133,38 @@ def register_jira_tools(mcp: FastMCP) -> None:
         ctx: Context,
     ) -> JiraCreateIssuesBatchResponse:
         """Create multiple Jira issues."""
-        with TOOL_DURATION.labels(tool_name="jira_create_issues_batch").time():
+        with create_batch_duration.time():
             await ctx.info(
                 f"Creating {len(issues)} Jira issues in project: {project_key}"
             )
             try:
                 jira_service = ctx.fastmcp.jira_service  # type: ignore[attr-defined]
-                # Convert to dict for service
-                issues_data = [issue.model_dump() for issue in issues]
+                # Convert to dicts for service in one call; the service
+                # defaults any field left out (e.g. issue_type -> Task)
+                issues_data = ISSUE_TO_CREATE_LIST_ADAPTER.dump_python(
+                    issues, exclude_none=True
+                )
 
-                await ctx.debug(f"Issue summaries: {[i.summary for i in issues]}")
+                if is_debug_enabled():
+                    await log_debug(
+                        ctx, "Issue summaries: %s", [i.summary for i in issues]
+                    )
                 created = await jira_service.create_issues_batch(
                     project_key=project_key,
                     issues=issues_data,
                 )
 
                 await ctx.info(f"Successfully created {len(created)} issues")
-                TOOL_CALLS.labels(
-                    tool_name="jira_create_issues_batch", status="success"
-                ).inc()
-                return JiraCreateIssuesBatchResponse(
-                    created=[JiraCreatedIssue(**issue) for issue in created]
+                create_batch_success.inc()
+                return JiraCreateIssuesBatchResponse.model_construct(
+                    created=CREATED_ISSUE_LIST_ADAPTER.validate_python(created)
                 )
 
             except JiraError as e:
-                TOOL_CALLS.labels(
-                    tool_name="jira_create_issues_batch", status="error"
-                ).inc()
+                create_batch_error.inc()
                 raise ToolError(e.message) from e
             except Exception as e:
-                TOOL_CALLS.labels(
-                    tool_name="jira_create_issues_batch", status="error"
-                ).inc()
+                create_batch_error.inc()
                 raise ToolError(f"Failed to create Jira issues: {e}") from e
 
     @mcp.tool(
@@ -173,21 +193,22 @@ def register_jira_tools(mcp: FastMCP) -> None:
         await ctx.info(f"Updating Jira issue: {issue_key}")
         try:
             jira_service = ctx.fastmcp.jira_service  # type: ignore[attr-defined]
-            # Build list of fields being updated
-            updates = []
-            if summary:
-                updates.append("summary")
-            if description:
-                updates.append("description")
-            if status:
-                updates.append(f"status={status}")
-            if assignee:
-                updates.append("assignee")
-            if labels:
-                updates.append("labels")
-            if due_date:
-                updates.append("due_date")
-            await ctx.debug(f"Updating fields: {updates}")
+            if is_debug_enabled():
+                # List of fields being updated
+                fields = (
+                    ("summary", summary),
+                    ("description", description),
+                    ("status", status),
+                    ("assignee", assignee),
+                    ("labels", labels),
+                    ("due_date", due_date),
+                )
+                updates = [
+                    f"status={value}" if name == "status" else name
+                    for name, value in fields
+                    if value
+                ]
+                await log_debug(ctx, "Updating fields: %s", updates)
 
             result = await jira_service.update_issue(
                 issue_key=issue_key,
@@ -221,7 +242,7 @@ def register_jira_tools(mcp: FastMCP) -> None:
         await ctx.info(f"Adding comment to Jira issue: {issue_key}")
         try:
             jira_service = ctx.fastmcp.jira_service  # type: ignore[attr-defined]
-            await ctx.debug(f"Comment length: {len(body)} chars")
+            await log_debug(ctx, "Comment length: %s chars", len(body))
             result = await jira_service.add_comment(
                 issue_key=issue_key,
                 body=body,
@@ -44,6 +44,43 @@ class PmLinkMeetingIssuesResponse(BaseMcpModel):
     )
 
 
+# Link meetings batch models
+class PmMeetingLinkItem(BaseMcpModel):
+    """Single meeting to link in pm_link_meetings_batch."""
+
+    calendar_event_id: str = Field(description="Google Calendar event ID")
+    jira_issue_keys: list[str] = Field(
+        description="Jira issue keys to link (e.g., ['PROJ-1', 'PROJ-2'])"
+    )
+    confluence_page_id: str | None = Field(
+        default=None,
+        description="Optional Confluence page ID with meeting notes",
+    )
+
+
+class PmMeetingLinkResult(BaseMcpModel):
+    """Outcome of one meeting link in pm_link_meetings_batch."""
+
+    calendar_event_id: str = Field(description="Calendar event ID")
+    jira_issue_keys: list[str] | None = Field(
+        default=None, description="Linked issue keys (None if linking failed)"
+    )
+    confluence_page_id: str | None = Field(
+        default=None, description="Linked Confluence page ID"
+    )
+    error: str | None = Field(
+        default=None, description="Error message if this meeting failed to link"
+    )
+
+
+class PmLinkMeetingsBatchResponse(BaseMcpModel):
+    """Response model for pm_link_meetings_batch tool."""
+
+    results: list[PmMeetingLinkResult] = Field(
+        description="Per-meeting results, in request order"
+    )
+
+
 # Get meeting issues models
 class PmGetMeetingIssuesRequest(BaseMcpModel):
     """Request model for pm_get_meeting_issues tool."""
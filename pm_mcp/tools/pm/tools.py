@@ -1,28 +1,63 @@
 """PM layer MCP tools implementation."""
 
+import asyncio
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
 from fastmcp.server.context import Context
 from pydantic import Field
 
-from pm_mcp.core.errors import PmError
+from pm_mcp.core.context import log_debug
+from pm_mcp.core.errors import JiraError, PmError
 from pm_mcp.core.metrics import TOOL_CALLS, TOOL_DURATION
-from pm_mcp.tools.jira.models import JiraIssueSummary
+from pm_mcp.tools.jira.models import ISSUE_SUMMARY_LIST_ADAPTER
 from pm_mcp.tools.pm.models import (
     PmGetMeetingIssuesResponse,
     PmLinkMeetingIssuesResponse,
+    PmLinkMeetingsBatchResponse,
+    PmMeetingLinkItem,
+    PmMeetingLinkResult,
     PmProjectSnapshot,
 )
 
+# Max concurrent per-key Jira fallback fetches in pm_get_meeting_issues (rate limits)
+ISSUE_FETCH_CONCURRENCY = 10
+
 
 def register_pm_tools(mcp: FastMCP) -> None:
     """Register PM layer tools with the MCP server.
 
     Tools access services via ctx.fastmcp (jira_service, pm_service).
     """
+    # Bind metric children once instead of resolving labels on every call
+    link_duration = TOOL_DURATION.labels(tool_name="pm_link_meeting_issues")
+    link_success = TOOL_CALLS.labels(
+        tool_name="pm_link_meeting_issues", status="success"
+    )
+    link_error = TOOL_CALLS.labels(tool_name="pm_link_meeting_issues", status="error")
+    link_batch_duration = TOOL_DURATION.labels(tool_name="pm_link_meetings_batch")
+    link_batch_success = TOOL_CALLS.labels(
+        tool_name="pm_link_meetings_batch", status="success"
+    )
+    link_batch_error = TOOL_CALLS.labels(
+        tool_name="pm_link_meetings_batch", status="error"
+    )
+    meeting_issues_duration = TOOL_DURATION.labels(tool_name="pm_get_meeting_issues")
+    meeting_issues_success = TOOL_CALLS.labels(
+        tool_name="pm_get_meeting_issues", status="success"
+    )
+    meeting_issues_error = TOOL_CALLS.labels(
+        tool_name="pm_get_meeting_issues", status="error"
+    )
+    snapshot_duration = TOOL_DURATION.labels(tool_name="pm_get_project_snapshot")
+    snapshot_success = TOOL_CALLS.labels(
+        tool_name="pm_get_project_snapshot", status="success"
+    )
+    snapshot_error = TOOL_CALLS.labels(
+        tool_name="pm_get_project_snapshot", status="error"
+    )
 
     @mcp.tool(
         name="pm_link_meeting_issues",
@@ -57,7 +92,7 @@ def register_pm_tools(mcp: FastMCP) -> None:
         ] = None,
     ) -> PmLinkMeetingIssuesResponse:
         """Link meeting to Jira issues."""
-        with TOOL_DURATION.labels(tool_name="pm_link_meeting_issues").time():
+        with link_duration.time():
             await ctx.info(
                 f"Linking meeting {calendar_event_id} to {len(jira_issue_keys)} issues"
             )
@@ -74,16 +109,18 @@ def register_pm_tools(mcp: FastMCP) -> None:
                     raise ToolError("Jira service not available")
 
                 # Resolve calendar_id from project_key
-                await ctx.debug(f"Resolving calendar for project: {project_key}")
+                await log_debug(ctx, "Resolving calendar for project: %s", project_key)
                 calendar = await calendar_service.find_or_create_project_calendar(
                     project_key=project_key
                 )
                 calendar_id = calendar["calendar_id"]
-                await ctx.debug(f"Resolved calendar_id: {calendar_id}")
 
-                await ctx.debug(
-                    f"Issue keys: {jira_issue_keys}, "
-                    f"confluence_page_id={confluence_page_id}"
+                await log_debug(
+                    ctx,
+                    "Resolved calendar_id: %s, issue keys: %s, confluence_page_id=%s",
+                    calendar_id,
+                    jira_issue_keys,
+                    confluence_page_id,
                 )
                 result = await pm_service.link_meeting_issues(
                     calendar_service=calendar_service,
@@ -104,9 +141,7 @@ def register_pm_tools(mcp: FastMCP) -> None:
                     )
 
                 await ctx.info("Successfully linked meeting to issues")
-                TOOL_CALLS.labels(
-                    tool_name="pm_link_meeting_issues", status="success"
-                ).inc()
+                link_success.inc()
                 return PmLinkMeetingIssuesResponse(
                     calendar_event_id=result["meeting_id"],
                     jira_issue_keys=result["issue_keys"],
@@ -114,21 +149,103 @@ def register_pm_tools(mcp: FastMCP) -> None:
                 )
 
             except PmError as e:
-                TOOL_CALLS.labels(
-                    tool_name="pm_link_meeting_issues", status="error"
-                ).inc()
+                link_error.inc()
                 raise ToolError(e.message) from e
             except ToolError:
-                TOOL_CALLS.labels(
-                    tool_name="pm_link_meeting_issues", status="error"
-                ).inc()
+                link_error.inc()
                 raise
             except Exception as e:
-                TOOL_CALLS.labels(
-                    tool_name="pm_link_meeting_issues", status="error"
-                ).inc()
+                link_error.inc()
                 raise ToolError(f"Failed to link meeting to issues: {e}") from e
 
+    @mcp.tool(
+        name="pm_link_meetings_batch",
+        description="Link several calendar meetings to Jira issues in one call. "
+        "Use instead of repeated pm_link_meeting_issues calls, e.g. when importing "
+        "links for many meetings. A failed meeting does not abort the others. "
+        "Requires project_key to determine which calendar.",
+    )
+    async def pm_link_meetings_batch(
+        project_key: Annotated[
+            str,
+            Field(description="Jira project key to determine calendar"),
+        ],
+        items: Annotated[
+            list[PmMeetingLinkItem],
+            Field(description="Meetings to link with their Jira issue keys"),
+        ],
+        ctx: Context,
+    ) -> PmLinkMeetingsBatchResponse:
+        """Link several meetings to Jira issues."""
+        with link_batch_duration.time():
+            await ctx.info(f"Linking {len(items)} meetings to Jira issues")
+            try:
+                pm_service = ctx.fastmcp.pm_service  # type: ignore[attr-defined]
+                calendar_service = ctx.fastmcp.calendar_service  # type: ignore[attr-defined]
+                jira_service = ctx.fastmcp.jira_service  # type: ignore[attr-defined]
+
+                if pm_service is None:
+                    raise ToolError("PM service not available")
+                if calendar_service is None:
+                    raise ToolError("Calendar service not available")
+                if jira_service is None:
+                    raise ToolError("Jira service not available")
+
+                # Resolve calendar_id from project_key
+                await log_debug(ctx, "Resolving calendar for project: %s", project_key)
+                calendar = await calendar_service.find_or_create_project_calendar(
+                    project_key=project_key
+                )
+                calendar_id = calendar["calendar_id"]
+                await log_debug(ctx, "Resolved calendar_id: %s", calendar_id)
+
+                results = await pm_service.link_meetings_batch(
+                    calendar_service=calendar_service,
+                    jira_service=jira_service,
+                    calendar_id=calendar_id,
+                    items=[
+                        {
+                            "meeting_id": item.calendar_event_id,
+                            "issue_keys": item.jira_issue_keys,
+                            "confluence_page_id": item.confluence_page_id,
+                            "project_key": project_key,
+                        }
+                        for item in items
+                    ],
+                )
+
+                failed = sum("error" in result for result in results)
+                if failed:
+                    await ctx.warning(
+                        f"{failed} of {len(items)} meetings failed to link"
+                    )
+                if any("label_errors" in result for result in results):
+                    await ctx.warning("Some Jira labels failed to add")
+
+                await ctx.info(f"Linked {len(items) - failed} meetings to issues")
+                link_batch_success.inc()
+                return PmLinkMeetingsBatchResponse(
+                    results=[
+                        PmMeetingLinkResult(
+                            calendar_event_id=item.calendar_event_id,
+                            jira_issue_keys=result.get("issue_keys"),
+                            confluence_page_id=result.get("confluence_page_id"),
+                            error=result.get("error"),
+                        )
+                        for item, result in zip(items, results)
+                    ]
+                )
+
+            except PmError as e:
+                link_batch_error.inc()
+                raise ToolError(e.message) from e
+            except ToolError:
+                link_batch_error.inc()
+                raise
+            except Exception as e:
+                link_batch_error.inc()
+                raise ToolError(f"Failed to link meetings to issues: {e}") from e
+
     @mcp.tool(
         name="pm_get_meeting_issues",
         description="Get Jira issues linked to a meeting. "
@@ -146,7 +263,7 @@ def register_pm_tools(mcp: FastMCP) -> None:
         ctx: Context,
     ) -> PmGetMeetingIssuesResponse:
         """Get issues linked to a meeting."""
-        with TOOL_DURATION.labels(tool_name="pm_get_meeting_issues").time():
+        with meeting_issues_duration.time():
             await ctx.info(f"Getting issues linked to meeting: {calendar_event_id}")
             try:
                 pm_service = ctx.fastmcp.pm_service  # type: ignore[attr-defined]
@@ -159,12 +276,12 @@ def register_pm_tools(mcp: FastMCP) -> None:
                     raise ToolError("Calendar service not available")
 
                 # Resolve calendar_id from project_key
-                await ctx.debug(f"Resolving calendar for project: {project_key}")
+                await log_debug(ctx, "Resolving calendar for project: %s", project_key)
                 calendar = await calendar_service.find_or_create_project_calendar(
                     project_key=project_key
                 )
                 calendar_id = calendar["calendar_id"]
-                await ctx.debug(f"Resolved calendar_id: {calendar_id}")
+                await log_debug(ctx, "Resolved calendar_id: %s", calendar_id)
 
                 # Get meeting link data from Calendar
                 meeting_data = await pm_service.get_meeting_issues(
@@ -178,23 +295,47 @@ def register_pm_tools(mcp: FastMCP) -> None:
                 issues = []
 
                 if issue_keys:
-                    await ctx.debug(
-                        f"Fetching {len(issue_keys)} linked issues from Jira"
+                    await log_debug(
+                        ctx, "Fetching %s linked issues from Jira", len(issue_keys)
+                    )
+                    # One JQL search for all keys instead of a request per key
+                    try:
+                        found = await jira_service.get_issues_by_keys(issue_keys)
+                    except JiraError:
+                        # A deleted key fails the whole query; fetch keys one by one
+                        found = []
+                    issues_by_key = {issue["key"]: issue for issue in found}
+
+                    # Keys the search missed (deleted/moved issues): fetch directly
+                    missing_keys = [k for k in issue_keys if k not in issues_by_key]
+                    if missing_keys:
+                        semaphore = asyncio.Semaphore(ISSUE_FETCH_CONCURRENCY)
+
+                        async def fetch_issue(key: str) -> dict[str, Any] | None:
+                            async with semaphore:
+                                return await jira_service.get_issue(key)
+
+                        results = await asyncio.gather(
+                            *(fetch_issue(key) for key in missing_keys),
+                            return_exceptions=True,
+                        )
+                        for key, issue in zip(missing_keys, results):
+                            if isinstance(issue, Exception) or not issue:
+                                await ctx.warning(f"Could not fetch issue: {key}")
+                            else:
+                                issues_by_key[key] = issue
+
+                    issues = ISSUE_SUMMARY_LIST_ADAPTER.validate_python(
+                        [
+                            issues_by_key[key]
+                            for key in issue_keys
+                            if key in issues_by_key
+                        ]
                     )
-                    # Fetch each issue directly by key (more efficient than text search)
-                    for key in issue_keys:
-                        try:
-                            issue = await jira_service.get_issue(key)
-                            if issue:
-                                issues.append(JiraIssueSummary(**issue))
-                        except Exception:
-                            await ctx.warning(f"Could not fetch issue: {key}")
 
                 await ctx.info(f"Retrieved {len(issues)} issues for meeting")
-                TOOL_CALLS.labels(
-                    tool_name="pm_get_meeting_issues", status="success"
-                ).inc()
-                return PmGetMeetingIssuesResponse(
+                meeting_issues_success.inc()
+                return PmGetMeetingIssuesResponse.model_construct(
                     calendar_event_id=calendar_event_id,
                     issues=issues,
                     confluence_page_id=meeting_data.get("confluence_page_id"),
@@ -203,19 +344,13 @@ def register_pm_tools(mcp: FastMCP) -> None:
                 )
 
             except PmError as e:
-                TOOL_CALLS.labels(
-                    tool_name="pm_get_meeting_issues", status="error"
-                ).inc()
+                meeting_issues_error.inc()
                 raise ToolError(e.message) from e
             except ToolError:
-                TOOL_CALLS.labels(
-                    tool_name="pm_get_meeting_issues", status="error"
-                ).inc()
+                meeting_issues_error.inc()
                 raise
             except Exception as e:
-                TOOL_CALLS.labels(
-                    tool_name="pm_get_meeting_issues", status="error"
-                ).inc()
+                meeting_issues_error.inc()
                 raise ToolError(f"Failed to get meeting issues: {e}") from e
 
     @mcp.tool(
@@ -233,7 +368,7 @@ def register_pm_tools(mcp: FastMCP) -> None:
         ] = None,
     ) -> PmProjectSnapshot:
         """Get project statistics snapshot."""
-        with TOOL_DURATION.labels(tool_name="pm_get_project_snapshot").time():
+        with snapshot_duration.time():
             await ctx.info(f"Getting project snapshot for: {project_key}")
             try:
                 pm_service = ctx.fastmcp.pm_service  # type: ignore[attr-defined]
@@ -243,7 +378,7 @@ def register_pm_tools(mcp: FastMCP) -> None:
                     raise ToolError("PM service not available")
 
                 if since:
-                    await ctx.debug(f"Calculating progress since: {since}")
+                    await log_debug(ctx, "Calculating progress since: %s", since)
                 result = await pm_service.get_project_snapshot(
                     project_key=project_key,
                     jira_service=jira_service,
@@ -254,23 +389,15 @@ def register_pm_tools(mcp: FastMCP) -> None:
                     f"Snapshot: {result.get('total_issues', 0)} total issues, "
                     f"{result.get('overdue_count', 0)} overdue"
                 )
-                TOOL_CALLS.labels(
-                    tool_name="pm_get_project_snapshot", status="success"
-                ).inc()
+                snapshot_success.inc()
                 return PmProjectSnapshot(**result)
 
             except PmError as e:
-                TOOL_CALLS.labels(
-                    tool_name="pm_get_project_snapshot", status="error"
-                ).inc()
+                snapshot_error.inc()
                 raise ToolError(e.message) from e
             except ToolError:
-                TOOL_CALLS.labels(
-                    tool_name="pm_get_project_snapshot", status="error"
-                ).inc()
+                snapshot_error.inc()
                 raise
             except Exception as e:
-                TOOL_CALLS.labels(
-                    tool_name="pm_get_project_snapshot", status="error"
-                ).inc()
+                snapshot_error.inc()
                 raise ToolError(f"Failed to get project snapshot: {e}") from e